@@ -54,6 +54,19 @@ class SrtFileHandler(SubtitleFileHandler):
         Returns:
             str: SRT formatted subtitle content
         """
+        return srt.compose(self._build_srt_items(data), reindex=False)
+
+    def write_to(self, data: SubtitleData, stream: TextIO) -> None:
+        """
+        Write subtitle lines to a stream in SRT format block by block, rather than joining them into a single string.
+        """
+        for srt_item in self._build_srt_items(data):
+            stream.write(srt_item.to_srt())
+
+    def _build_srt_items(self, data: SubtitleData) -> list[srt.Subtitle]:
+        """
+        Filter, renumber and convert subtitle lines to SRT items for composing.
+        """
         from PySubtrans.Helpers.Text import IsRightToLeftText
         
         # Filter out invalid lines and renumber for SRT compliance
@@ -98,7 +111,7 @@ class SrtFileHandler(SubtitleFileHandler):
             )
             srt_items.append(srt_item)
         
-        return srt.compose(srt_items, reindex=False)
+        return srt_items
 
     def _parse_srt_items(self, source) -> Iterator[SubtitleLine]:
         """
@@ -1,3 +1,4 @@
+import functools
 import regex
 from datetime import timedelta
 from typing import TextIO
@@ -12,6 +13,16 @@ from PySubtrans.SubtitleData import SubtitleData
 from PySubtrans.SubtitleError import SubtitleParseError
 from PySubtrans.Helpers.Localization import _
 
+# Regex patterns for VTT parsing
+_TIMESTAMP_PATTERN = regex.compile(
+    r'(?:(\d{2,}):)?(\d{2}):(\d{2})\.(\d{3})\s*-->\s*(?:(\d{2,}):)?(\d{2}):(\d{2})\.(\d{3})(.*)'
+)
+_VOICE_TAG_PATTERN = regex.compile(r'^\s*<v((?:\.[\w-]+)*)(?:\s+([^>]+))?>((?:(?!</?v).)*)</v>\s*$')
+_STYLE_BLOCK_START = regex.compile(r'^\s*STYLE\s*$')
+_NOTE_BLOCK_START = regex.compile(r'^\s*NOTE(?:\s.*)?$')
+# Either of the above, for checks that only need to know whether a new block starts
+_BLOCK_START = regex.compile(r'^\s*(?:STYLE\s*|NOTE(?:\s.*)?)$')
+
 
 class VttFileHandler(SubtitleFileHandler):
     """
@@ -22,14 +33,6 @@ class VttFileHandler(SubtitleFileHandler):
     """
     
     SUPPORTED_EXTENSIONS = {'.vtt': 10}
-    
-    # Regex patterns for VTT parsing
-    _TIMESTAMP_PATTERN = regex.compile(
-        r'(?:(\d{2,}):)?(\d{2}):(\d{2})\.(\d{3})\s*-->\s*(?:(\d{2,}):)?(\d{2}):(\d{2})\.(\d{3})(.*)'
-    )
-    _VOICE_TAG_PATTERN = regex.compile(r'^\s*<v((?:\.[\w-]+)*)(?:\s+([^>]+))?>((?:(?!</?v).)*)</v>\s*$')
-    _STYLE_BLOCK_START = regex.compile(r'^\s*STYLE\s*$')
-    _NOTE_BLOCK_START = regex.compile(r'^\s*NOTE(?:\s.*)?$')
 
     def load_file(self, path: str) -> SubtitleData:
         try:
@@ -123,6 +126,10 @@ class VttFileHandler(SubtitleFileHandler):
         hours, minutes, seconds, milliseconds = [int(p or 0) for p in time_parts]
         return timedelta(hours=hours, minutes=minutes, seconds=seconds, milliseconds=milliseconds)
     
+    def _match_timing(self, line: str) -> regex.Match|None:
+        """Match a cue timing line, skipping the regex for lines that cannot be one (most lines are cue text)."""
+        return _TIMESTAMP_PATTERN.match(line) if '-->' in line else None
+    
     def _parse_file_header(self, lines: list[str]) -> dict:
         """Parse WebVTT file header including extended headers."""
         header_lines = [lines[0].strip()]
@@ -147,9 +154,7 @@ class VttFileHandler(SubtitleFileHandler):
     
     def _is_content_line(self, line: str) -> bool:
         """Check if line looks like content rather than header metadata."""
-        return bool(self._TIMESTAMP_PATTERN.match(line) or 
-                self._STYLE_BLOCK_START.match(line) or 
-                self._NOTE_BLOCK_START.match(line))
+        return bool(self._match_timing(line) or _BLOCK_START.match(line))
     
     def _parse_cues(self, lines: list[str], file_metadata: dict) -> list[SubtitleLine]:
         """Parse all cues from lines starting after header."""
@@ -164,13 +169,13 @@ class VttFileHandler(SubtitleFileHandler):
                 i += 1
                 continue
             
-            if self._STYLE_BLOCK_START.match(line):
+            if _STYLE_BLOCK_START.match(line):
                 style_block, i = self._parse_style_block(lines, i + 1)
                 if style_block:
                     file_metadata['vtt_styles'].append(style_block)
                 continue
             
-            if self._NOTE_BLOCK_START.match(line):
+            if _NOTE_BLOCK_START.match(line):
                 note_content, i = self._parse_note_block(lines, i)
                 if note_content:
                     file_metadata['vtt_notes'].append(note_content)
@@ -191,14 +196,14 @@ class VttFileHandler(SubtitleFileHandler):
         cue_id = None
         timestamp_line_idx = i
         
-        if i + 1 < len(lines) and self._TIMESTAMP_PATTERN.match(lines[i + 1].strip()):
+        # Keep the match when the next line is the timing line, rather than matching it again
+        timestamp_match = self._match_timing(lines[i + 1].strip()) if i + 1 < len(lines) else None
+        if timestamp_match:
             cue_id = lines[i].strip()
             timestamp_line_idx = i + 1
+        elif i < len(lines):
+            timestamp_match = self._match_timing(lines[i].strip())
         
-        if timestamp_line_idx >= len(lines):
-            return None, i + 1
-            
-        timestamp_match = self._TIMESTAMP_PATTERN.match(lines[timestamp_line_idx].strip())
         if not timestamp_match:
             return None, i + 1
         
@@ -239,12 +244,17 @@ class VttFileHandler(SubtitleFileHandler):
     
     def _format_timestamp(self, td: timedelta) -> str:
         """Format timedelta as WebVTT timestamp."""
-        total_seconds = int(td.total_seconds())
-        milliseconds = td.microseconds // 1000
-        
-        hours = total_seconds // 3600
-        minutes = (total_seconds % 3600) // 60
-        seconds = total_seconds % 60
+        # Work from the normalised integer fields rather than dividing timedeltas
+        total_ms = td.days * 86_400_000 + td.seconds * 1000 + td.microseconds // 1000
+        return self._format_milliseconds(total_ms)
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
+    def _format_milliseconds(total_ms: int) -> str:
+        """Format a millisecond offset as a WebVTT timestamp (cached, as cue boundaries are often shared)."""
+        hours, remainder = divmod(total_ms, 3_600_000)
+        minutes, remainder = divmod(remainder, 60_000)
+        seconds, milliseconds = divmod(remainder, 1000)
         
         return f"{hours:02d}:{minutes:02d}:{seconds:02d}.{milliseconds:03d}"
     
@@ -256,7 +266,7 @@ class VttFileHandler(SubtitleFileHandler):
         while i < len(lines):
             line = lines[i].strip()
             
-            if not line or self._STYLE_BLOCK_START.match(line) or self._NOTE_BLOCK_START.match(line):
+            if not line or _BLOCK_START.match(line):
                 break
             
             style_lines.append(lines[i])
@@ -272,7 +282,7 @@ class VttFileHandler(SubtitleFileHandler):
         while i < len(lines):
             line = lines[i].strip()
             
-            if not line or self._STYLE_BLOCK_START.match(line) or self._NOTE_BLOCK_START.match(line):
+            if not line or _BLOCK_START.match(line):
                 break
             
             note_lines.append(lines[i])
@@ -289,7 +299,7 @@ class VttFileHandler(SubtitleFileHandler):
         processed_text = text
         
         # Only process voice tags that wrap the entire line
-        voice_match = self._VOICE_TAG_PATTERN.match(processed_text)
+        voice_match = _VOICE_TAG_PATTERN.match(processed_text)
         if voice_match:
             css_classes, speaker_name, voice_content = voice_match.groups()
             
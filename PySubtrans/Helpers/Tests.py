@@ -13,10 +13,19 @@ from PySubtrans.Subtitles import Subtitles
 separator = "".center(60, "-")
 wide_separator = "".center(120, "-")
 
+def _info_enabled() -> bool:
+    """
+    Check whether info messages would be logged, so that formatting them can be skipped if not.
+    """
+    return logging.getLogger().isEnabledFor(logging.INFO)
+
 def log_info(text: str, prefix: str = ""):
     """
     Logs a string as individual lines with an optional prefix on each line using logging.info.
     """
+    if not _info_enabled():
+        return
+
     for line in text.strip().split("\n"):
         logging.info(f"{prefix}{line}")
 
@@ -31,6 +40,9 @@ def log_test_name(test_name: str):
     """
     Logs the name of the test with a separator before and after.
     """
+    if not _info_enabled():
+        return
+
     logging.info(separator)
     log_info(test_name.center(len(separator)))
     logging.info(separator)
@@ -39,33 +51,39 @@ def log_expected_result(expected : Any, result : Any):
     """
     Logs the expected result and the actual result.
     """
-    log_info(str(expected), prefix="===".ljust(10))
-    log_info(str(result), prefix="-->".ljust(10))
+    if _info_enabled():
+        log_info(str(expected), prefix="===".ljust(10))
+        log_info(str(result), prefix="-->".ljust(10))
     if expected != result:
         log_error("*** UNEXPECTED RESULT! ***", prefix="!!!".ljust(10))
-    logging.info(separator)
+    if _info_enabled():
+        logging.info(separator)
 
 def log_input_expected_result(input : Any, expected : Any, result : Any):
     """
     Logs the input value, the expected result and the actual result.
     """
-    log_info(str(input), prefix="".ljust(10))
-    log_info(str(expected), prefix="===".ljust(10))
-    log_info(str(result), prefix="-->".ljust(10))
+    if _info_enabled():
+        log_info(str(input), prefix="".ljust(10))
+        log_info(str(expected), prefix="===".ljust(10))
+        log_info(str(result), prefix="-->".ljust(10))
     if expected != result:
         log_error("*** UNEXPECTED RESULT! ***", prefix="!!!".ljust(10))
-    logging.info(separator)
+    if _info_enabled():
+        logging.info(separator)
 
 def log_input_expected_error(input : Any, expected_error : type[Exception], result : Any):
     """
     Logs the input value, the expected error and the actual error.
     """
-    log_info(str(input), prefix="".ljust(10))
-    log_info(expected_error.__name__, prefix="===".ljust(10))
+    if _info_enabled():
+        log_info(str(input), prefix="".ljust(10))
+        log_info(expected_error.__name__, prefix="===".ljust(10))
     if not isinstance(result, expected_error):
         log_error("*** UNEXPECTED ERROR! ***", prefix="!!!".ljust(10))
-    log_info(str(result), prefix="-->".ljust(10))
-    logging.info(separator)
+    if _info_enabled():
+        log_info(str(result), prefix="-->".ljust(10))
+        logging.info(separator)
 
 
 def skip_if_debugger_attached(test_method):
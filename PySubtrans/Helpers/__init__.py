@@ -1,9 +1,12 @@
+from collections.abc import Iterator
+from contextlib import contextmanager
+import logging
 import os
 
-from typing import Any
+from typing import Any, TextIO
 
 import regex
-from PySubtrans.Helpers.Localization import LocaleDisplayItem
+from PySubtrans.Helpers.Localization import LocaleDisplayItem, _
 from PySubtrans.SubtitleError import SubtitleError
 
 def GetValueName(value : Any) -> str:
@@ -97,6 +100,28 @@ def GetOutputPath(filepath : str|None, language : str|None = None, format_extens
     output_path = os.path.join(directory, f"{basename}{format_extension}")
     return os.path.normpath(output_path)
 
+@contextmanager
+def OpenFileForAtomicWrite(path : str, encoding : str, newline : str|None = None) -> Iterator[TextIO]:
+    """
+    Open a temporary file for writing, then swap it into place at path when the block completes.
+
+    If the block raises, the temporary file is removed and any existing file at path is left untouched.
+    """
+    temp_path = f"{path}.tmp"
+    try:
+        with open(temp_path, 'w', encoding=encoding, newline=newline, buffering=1 << 20) as f:
+            yield f
+
+        os.replace(temp_path, path)
+
+    except Exception:
+        try:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+        except OSError as e:
+            logging.warning(_("Unable to remove temporary file {}: {}").format(temp_path, str(e)))
+        raise
+
 def FormatMessages(messages : list[dict[str,Any]]) -> str:
     lines : list[str] = []
     for index, message in enumerate(messages, start=1):
@@ -89,6 +89,7 @@ default_settings = {
     'max_retries': env_int('MAX_RETRIES', 1),
     'max_summary_length': env_int('MAX_SUMMARY_LENGTH', 240),
     'backoff_time': env_float('BACKOFF_TIME', 3.0),
+    'cache_responses': env_bool('CACHE_RESPONSES', False),
     'project_file' : env_bool('PROJECT_FILE', True),
     'autosave': env_bool('AUTOSAVE', True),
     'preview' : False,
@@ -208,7 +208,14 @@ class OpenRouterProvider(TranslationProvider):
             return False
 
         return True
-    
+
+    def _models_cache_key(self) -> tuple[str, ...]:
+        """
+        The model list is filtered by family, so the filter settings are part of the key
+        """
+        only_translation_models = str(self.settings.get_bool('only_translation_models', True))
+        return super()._models_cache_key() + (self.model_family or '', only_translation_models)
+
     def _populate_model_cache(self):
         """
         Fetch and cache models grouped by family from OpenRouter API
@@ -159,6 +159,10 @@ class SettingsType(dict[str, SettingType]):
         """Set a setting in the settings dictionary"""
         self[setting] = value
 
+    def clone(self) -> SettingsType:
+        """Copy the settings, duplicating nested lists and dicts so the copy can be modified independently"""
+        return SettingsType({ key : _clone_setting(value) for key, value in self.items() })
+
     def update(self, other=(), /, **kwds) -> None:
         """Update settings, filtering out None values"""
         # Match dict.update signature: update([other,] **kwds)
@@ -170,6 +174,18 @@ class SettingsType(dict[str, SettingType]):
                 other = {k: v for k, v in other.items() if v is not None}
         super().update(other, **kwds)
 
+def _clone_setting(value : Any) -> Any:
+    """
+    Copy a setting value, recursing into containers (much cheaper than deepcopy for plain settings data)
+    """
+    if isinstance(value, SettingsType):
+        return value.clone()
+    if isinstance(value, dict):
+        return { key : _clone_setting(item) for key, item in value.items() }
+    if isinstance(value, list):
+        return [ _clone_setting(item) for item in value ]
+    return value
+
 def redact_sensitive_values(settings : SettingsType) -> SettingsType:
     """
     Return a copy of settings with any potential secrets redacted.
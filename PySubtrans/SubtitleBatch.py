@@ -50,12 +50,13 @@ class SubtitleBatch:
     @property
     def all_translated(self) -> bool:
         """ Check if all original lines have a translation """
-        return True if (self.translated and (len(self.translated) == len(self.originals))) else False
+        translated = self._translated
+        return bool(translated) and len(translated) == len(self._originals)
 
     @property
     def any_translated(self) -> bool:
         """ Check if any original lines have a translation """
-        return len(self.translated or []) > 0
+        return bool(self._translated)
 
     @property
     def start(self) -> timedelta|None:
@@ -58,6 +58,20 @@ class SubtitleFileHandler(ABC):
         """
         raise NotImplementedError
 
+    def write_to(self, data: SubtitleData, stream: TextIO) -> None:
+        """
+        Compose subtitle lines and write them to a text stream.
+
+        Handlers that can produce output incrementally should override this to avoid
+        building the entire file in memory. The default implementation writes the
+        result of compose.
+
+        Args:
+            data: SubtitleData containing subtitle content and metadata
+            stream: Text stream to write the composed subtitles to
+        """
+        stream.write(self.compose(data))
+
     @abstractmethod
     def load_file(self, path: str) -> SubtitleData:
         """
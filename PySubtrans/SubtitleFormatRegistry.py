@@ -1,5 +1,9 @@
+import io
 import logging
 import os
+import threading
+from collections.abc import Callable
+from typing import TextIO
 
 import pysubs2
 
@@ -21,10 +25,14 @@ class SubtitleFormatRegistry:
     Handlers are registered by their supported file extensions and priorities.
 
     Provides methods to create handler instances based on file extensions or filenames.
+
+    Registration and discovery are serialised by a lock so the registry can be populated from several threads.
+    Lookups do not take the lock.
     """
     _handlers : dict[str, type[SubtitleFileHandler]] = {}
     _priorities : dict[str, int] = {}
     _discovered : bool = False
+    _lock = threading.RLock()
 
     @classmethod
     def register_handler(cls, handler_class : type[SubtitleFileHandler]) -> None:
@@ -33,11 +41,12 @@ class SubtitleFormatRegistry:
         """
         instance = handler_class()
         priorities = instance.get_extension_priorities()
-        for ext, priority in priorities.items():
-            ext = ext.lower()
-            if ext not in cls._handlers or priority >= cls._priorities[ext]:
-                cls._handlers[ext] = handler_class
-                cls._priorities[ext] = priority
+        with cls._lock:
+            for ext, priority in priorities.items():
+                ext = ext.casefold()
+                if ext not in cls._handlers or priority >= cls._priorities[ext]:
+                    cls._handlers[ext] = handler_class
+                    cls._priorities[ext] = priority
 
     @classmethod
     def get_handler_by_extension(cls, extension : str) -> type[SubtitleFileHandler]:
@@ -45,10 +54,11 @@ class SubtitleFormatRegistry:
         Get the subtitle file handler class for the given extension.
         """
         cls._ensure_discovered()
-        ext = extension.lower()
-        if ext not in cls._handlers:
+        ext = extension.casefold()
+        handler = cls._handlers.get(ext)
+        if handler is None:
             raise ValueError(_("Unknown subtitle format: {extension}. Available formats: {available}").format(extension=extension, available=cls.list_available_formats()))
-        return cls._handlers[ext]
+        return handler
 
     @classmethod
     def create_handler(cls, extension: str|None = None, filename: str|None = None) -> SubtitleFileHandler:
@@ -85,8 +95,9 @@ class SubtitleFormatRegistry:
     @classmethod
     def disable_autodiscovery(cls) -> None:
         """ Disable automatic loading of subtitle formats (for testing) """
-        cls.clear()
-        cls._discovered = True
+        with cls._lock:
+            cls.clear()
+            cls._discovered = True
 
     @classmethod
     def enable_autodiscovery(cls) -> None:
@@ -101,10 +112,11 @@ class SubtitleFormatRegistry:
         # Import the formats package, which will trigger explicit imports
         from . import Formats  # type: ignore[ignore-unused]
 
-        for handler_class in SubtitleFileHandler.__subclasses__():
-            cls.register_handler(handler_class)
+        with cls._lock:
+            for handler_class in SubtitleFileHandler.__subclasses__():
+                cls.register_handler(handler_class)
 
-        cls._discovered = True
+            cls._discovered = True
         logging.debug(f"Supported formats: {sorted(cls._handlers.keys())}")
 
     @classmethod
@@ -112,17 +124,18 @@ class SubtitleFormatRegistry:
         """
         Clear all registered handlers
         """
-        cls._handlers.clear()
-        cls._priorities.clear()
-        cls._discovered = False
+        with cls._lock:
+            cls._handlers.clear()
+            cls._priorities.clear()
+            cls._discovered = False
 
     @classmethod
-    def get_format_from_filename(cls, filename):
+    def get_format_from_filename(cls, filename : str) -> str|None:
         """
         Deduce subtitle format from file extension
         """
         base, extension = os.path.splitext(filename) # type: ignore[ignore-unused]
-        return extension.lower() if extension else None
+        return extension.casefold() if extension else None
 
     @classmethod
     def detect_format_from_content(cls, content: str) -> str|None:
@@ -146,16 +159,34 @@ class SubtitleFormatRegistry:
             raise SubtitleParseError(_("Failed to detect subtitle format: {}" ).format(str(e)), e)
 
     @classmethod
-    def detect_format_and_load_file(cls, path: str) -> SubtitleData:
+    def detect_format_and_load_file(cls, path: str, *, failed_format: str|None = None, failed_error: SubtitleParseError|None = None, _load_fn : Callable[[TextIO], pysubs2.SSAFile] = pysubs2.SSAFile.from_file) -> SubtitleData:
         """
         Detect subtitle format using content and load file accordingly.
+
+        If the caller has already tried to load the file as failed_format, it is not parsed again
+        with the same handler when the content is detected as that format. In that case failed_error,
+        the error raised by the handler, is re-raised so that the caller sees why the file failed to parse.
+
+        _load_fn parses the decoded content for detection, and can be replaced for testing.
         """
         cls._ensure_discovered()
         try:
+            with open(path, 'rb') as f:
+                raw = f.read()
+
+            # Decide the encoding once so that the content is only parsed once
             try:
-                subs = pysubs2.load(path, encoding=default_encoding)
+                text = raw.decode(default_encoding)
             except UnicodeDecodeError:
-                subs = pysubs2.load(path, encoding=fallback_encoding)
+                text = raw.decode(fallback_encoding)
+
+            # Empty or binary content cannot be a text subtitle format, so don't ask the parser to try
+            if not text or text.isspace() or '\x00' in text:
+                raise SubtitleParseError(_("Could not detect subtitle format for file: {}" ).format(path))
+
+            subs = _load_fn(io.StringIO(text, newline=None))
+        except SubtitleParseError:
+            raise
         except Exception as e:
             raise SubtitleParseError(_("Failed to detect subtitle format: {}" ).format(str(e)), e)
 
@@ -169,6 +200,11 @@ class SubtitleFormatRegistry:
         if detected_extension not in cls._handlers:
             raise SubtitleParseError(_("Detected subtitle format '{format}' is not supported.").format(format=detected_extension))
 
+        if failed_format and detected_extension == failed_format.casefold():
+            if failed_error is not None:
+                raise failed_error
+            raise SubtitleParseError(_("Detected subtitle format '{format}' but the file could not be parsed").format(format=detected_extension))
+
         handler = cls.create_handler(detected_extension)
         
         data = handler.load_file(path)
@@ -179,5 +215,8 @@ class SubtitleFormatRegistry:
     @classmethod
     def _ensure_discovered(cls) -> None:
         if not cls._discovered:
-            cls.discover()
+            with cls._lock:
+                # Another thread may have completed discovery while we waited for the lock
+                if not cls._discovered:
+                    cls.discover()
 
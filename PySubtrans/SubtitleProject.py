@@ -2,13 +2,14 @@ import json
 import os
 import logging
 import threading
+from typing import Any, TextIO
 
-from PySubtrans.Helpers import GetOutputPath
+from PySubtrans.Helpers import GetOutputPath, OpenFileForAtomicWrite
 from PySubtrans.Helpers.Localization import _
 from PySubtrans.Helpers.Parse import ParseKeyValuePairs, ParseNames
 from PySubtrans.Substitutions import Substitutions
 from PySubtrans.Options import Options
-from PySubtrans.SettingsType import SettingsType
+from PySubtrans.SettingsType import SettingType, SettingsType
 from PySubtrans.SubtitleEditor import SubtitleEditor
 from PySubtrans.SubtitleError import SubtitleError, TranslationAbortedError
 from PySubtrans.SubtitleFormatRegistry import SubtitleFormatRegistry
@@ -45,6 +46,13 @@ class SubtitleProject:
         'instruction_file': None,
         'format': None,
     })
+
+    LEGACY_PROJECT_SETTINGS : frozenset[str] = frozenset({
+        'synopsis', 'characters', 'gpt_prompt', 'gpt_model', 'match_partial_words'
+    })
+
+    # Indent with tabs rather than spaces to keep project files small without sacrificing readability
+    PROJECT_FILE_INDENT : str = '\t'
    
     def __init__(self, persistent : bool = False):
         """
@@ -82,13 +90,14 @@ class SubtitleProject:
 
     @property
     def any_translated(self) -> bool:
-        with self.lock:
-            return bool(self.subtitles and self.subtitles.any_translated)
+        # Read-only, so no need to take the lock - subtitles are only ever rebound
+        subtitles = self.subtitles
+        return bool(subtitles and subtitles.any_translated)
 
     @property
     def all_translated(self) -> bool:
-        with self.lock:
-            return bool(self.subtitles and self.subtitles.all_translated)
+        subtitles = self.subtitles
+        return bool(subtitles and subtitles.all_translated)
 
     @target_language.setter
     def target_language(self, value : str|None) -> None:
@@ -199,23 +208,21 @@ class SubtitleProject:
             # Route terminology_map edits to the dedicated attribute
             terminology_changed = self._parse_terminology_map(settings)
 
-            # Filter to known project settings only
-            filtered = SettingsType({key: settings[key] for key in settings if key in self.DEFAULT_PROJECT_SETTINGS})
-
-            # Parse names and substitutions into standard formats
-            self._standardise_settings_format(filtered)
+            # Filter, standardise and detect changes in a single pass, checking identity before equality so unchanged values are not compared
+            current = self.subtitles.settings
+            changed = SettingsType()
+            for key, value in settings.items():
+                if key not in self.DEFAULT_PROJECT_SETTINGS:
+                    continue
 
-            # Detect changes and update
-            common_keys = filtered.keys() & self.subtitles.settings.keys()
-            new_keys = filtered.keys() - self.subtitles.settings.keys()
-            settings_changed = bool(new_keys) or not all(
-                filtered.get(k) == self.subtitles.settings.get(k) for k in common_keys
-            )
+                value = self._standardise_setting(key, value)
+                if value is not current.get(key) and value != current.get(key):
+                    changed[key] = value
 
-            if settings_changed:
-                self.subtitles.UpdateSettings(filtered)
+            if changed:
+                self.subtitles.UpdateSettings(changed)
 
-            if settings_changed or terminology_changed:
+            if changed or terminology_changed:
                 self.needs_writing = self.use_project_file and bool(self.subtitles.scenes)
 
     def UpdateOutputPath(self, path: str|None = None, extension: str|None = None) -> None:
@@ -276,6 +283,10 @@ class SubtitleProject:
         """
         Calculate the project file path based on the source file path
         """
+        if filepath and filepath == self.projectfile:
+            # The project file path has already been calculated and normalised
+            return filepath
+
         path, ext = os.path.splitext(filepath)
         filepath = filepath if ext == '.subtrans' else f"{path}.subtrans"
         return os.path.normpath(filepath)
@@ -303,12 +314,18 @@ class SubtitleProject:
         Save the project file or translation file as needed
         """
         with self.lock:
-            if self.needs_writing:
-                if self.use_project_file:
-                    self.UpdateProjectFile()
-                if self.any_translated and self.write_translation:
-                    self.SaveTranslation()
-                self.needs_writing = False
+            if not self.needs_writing:
+                return
+
+            # The files are written one after the other, since both writes need the project lock
+            if self.use_project_file:
+                self.UpdateProjectFile()
+
+            # Check the cheap flag first, any_translated has to walk every scene
+            if self.write_translation and self.any_translated:
+                self.SaveTranslation()
+
+            self.needs_writing = False
 
     def UpdateProjectFile(self) -> None:
         """
@@ -365,13 +382,11 @@ class SubtitleProject:
             with self.lock:
                 logging.info(_("Reading project data from {}").format(str(filepath)))
 
-                with open(filepath, 'r', encoding=default_encoding, newline='') as f:
-                    self.subtitles: Subtitles = json.load(f, cls=SubtitleDecoder)
-
-                with SubtitleEditor(self.subtitles) as editor:
-                    editor.Sanitise()
+                # Read and decode in one step rather than through an incremental text decoder
+                with open(filepath, 'rb') as f:
+                    project_data = f.read().decode(default_encoding)
 
-                return self.subtitles
+                return self._load_project_json(project_data)
 
         except FileNotFoundError:
             logging.error(_("Project file {} not found").format(filepath))
@@ -381,6 +396,18 @@ class SubtitleProject:
             logging.error(_("Error decoding JSON file: {}").format(e))
             return None
 
+    def ReadProjectStream(self, stream : TextIO) -> Subtitles|None:
+        """
+        Load scenes, subtitles and context from serialised project data in a text stream
+        """
+        try:
+            with self.lock:
+                return self._load_project_json(stream.read())
+
+        except json.JSONDecodeError as e:
+            logging.error(_("Error decoding JSON file: {}").format(e))
+            return None
+
     def GetProjectSettings(self) -> SettingsType:
         """
         Return a dictionary of non-empty settings from the project file
@@ -388,7 +415,7 @@ class SubtitleProject:
         if not self.subtitles:
             return SettingsType()
 
-        return SettingsType({ key : value for key, value in self.subtitles.settings.items() if value is not None and (value != '' or isinstance(value, (list, dict))) })
+        return SettingsType({ key : value for key, value in self.subtitles.settings.items() if value is not None and value != '' })
 
     def WriteProjectToFile(self, projectfile: str, encoder_class: type|None = None) -> None:
         """
@@ -397,13 +424,26 @@ class SubtitleProject:
         if encoder_class is None:
             raise ValueError("No encoder provided")
 
-        projectfile = os.path.normpath(projectfile)
+        if projectfile != self.projectfile:
+            projectfile = os.path.normpath(projectfile)
+
         logging.info(_("Writing project data to {}").format(str(projectfile)))
 
         with self.lock:
-            with open(projectfile, 'w', encoding=default_encoding) as f:
-                project_json = json.dumps(self.subtitles, cls=encoder_class, ensure_ascii=False, indent=4) # type: ignore
-                f.write(project_json)
+            # Encode incrementally rather than building the whole document in memory first,
+            # and swap the completed file into place so an interrupted save cannot truncate the project
+            with OpenFileForAtomicWrite(projectfile, default_encoding, newline='') as f:
+                self.WriteProjectToStream(f, encoder_class=encoder_class)
+
+    def WriteProjectToStream(self, stream : TextIO, encoder_class: type|None = None) -> None:
+        """
+        Serialise the project to a text stream
+        """
+        if encoder_class is None:
+            raise ValueError("No encoder provided")
+
+        with self.lock:
+            json.dump(self.subtitles, stream, cls=encoder_class, ensure_ascii=False, indent=self.PROJECT_FILE_INDENT) # type: ignore
 
     def TranslateSubtitles(self, translator : SubtitleTranslator) -> None:
         """
@@ -489,6 +529,18 @@ class SubtitleProject:
             translator.events.terminology_updated.disconnect(self._on_terminology_updated)
             translator.events.disconnect_default_loggers()
 
+    def _load_project_json(self, project_data : str) -> Subtitles:
+        """
+        Decode serialised project data and replace the project's subtitles with it
+        """
+        with self.lock:
+            self.subtitles = json.loads(project_data, cls=SubtitleDecoder)
+
+            with SubtitleEditor(self.subtitles) as editor:
+                editor.Sanitise()
+
+            return self.subtitles
+
     def _set_project_setting(self, setting_name, value):
         """
         Set a project setting and mark the project as needing to be written if it changes
@@ -501,14 +553,26 @@ class SubtitleProject:
                 self.subtitles.settings[setting_name] = value
                 self.needs_writing = self.use_project_file
 
-    def _standardise_settings_format(self, filtered):
-        if 'names' in filtered:
-            filtered['names'] = ParseNames(filtered.get('names', []))
+    def _standardise_setting(self, key : str, value : SettingType) -> SettingType:
+        """
+        Parse names and substitutions into standard formats, skipping parsing for values that are already standardised.
+        Standardised values are copied so that the project does not share the caller's list or dict.
+        """
+        if key == 'names':
+            if isinstance(value, list) and all(self._is_parsed_name(name) for name in value):
+                return list(value)
+            return ParseNames(value)
 
-        if 'substitutions' in filtered:
-            subs = filtered.get('substitutions', [])
-            if subs:
-                filtered['substitutions'] = Substitutions.Parse(subs)
+        if key == 'substitutions' and value:
+            return dict(value) if isinstance(value, dict) else Substitutions.Parse(value)
+
+        return value
+
+    def _is_parsed_name(self, name : Any) -> bool:
+        """
+        Check whether a name is already in the form ParseNames would produce
+        """
+        return isinstance(name, str) and bool(name) and name == name.strip() and ',' not in name and '\n' not in name
 
     def _parse_terminology_map(self, filtered):
         terminology_changed = False
@@ -524,6 +588,9 @@ class SubtitleProject:
         """
         Update settings for compatibility with older versions
         """
+        if settings.get('substitution_mode') and settings.keys().isdisjoint(self.LEGACY_PROJECT_SETTINGS):
+            return
+
         if not settings.get('description') and settings.get('synopsis'):
             settings['description'] = settings.get('synopsis')
 
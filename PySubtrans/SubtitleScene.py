@@ -81,7 +81,13 @@ class SubtitleScene:
         self._batches = value
 
     def GetBatch(self, batch_number : int) -> SubtitleBatch|None:
-        for batch in self.batches:
+        batches = self.batches
+
+        # Batches are normally numbered sequentially from 1, so check the expected position first
+        if 0 < batch_number <= len(batches) and batches[batch_number - 1].number == batch_number:
+            return batches[batch_number - 1]
+
+        for batch in batches:
             if batch.number == batch_number:
                 return batch
 
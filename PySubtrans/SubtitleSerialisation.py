@@ -16,6 +16,16 @@ def classname(obj):
         return obj.__name__
     return type(obj).__name__
 
+# Class names are resolved once, since the decoder hook runs for every object in a project file
+_subtitles_class_names = { classname(Subtitles), "SubtitleFile" }     # Backward compatibility
+_scene_class_name = classname(SubtitleScene)
+_batch_class_name = classname(SubtitleBatch)
+_line_class_names = { classname(SubtitleLine), "Subtitle" }           # TEMP backward compatibility
+_translation_class_names = { classname(Translation), "GPTTranslation" }
+_prompt_class_name = classname(TranslationPrompt)
+_color_class_name = classname(Color)
+_error_class_name = classname(TranslationError)
+
 # Convert our custom types to JSON
 class SubtitleEncoder(json.JSONEncoder):
     def default(self, o):
@@ -39,12 +49,23 @@ class SubtitleEncoder(json.JSONEncoder):
         if obj is None:
             return None
 
-        if isinstance(obj, Subtitles):
+        # Lines are by far the most numerous objects, so test for them first
+        if isinstance(obj, SubtitleLine):
+            return {
+                "index": obj._index,
+                "start": obj.start.total_seconds() if obj.start else None,
+                "end": obj.end.total_seconds() if obj.end else None,
+                "content": obj.content,
+                "metadata": getattr(obj, 'metadata'),
+                "translation": getattr(obj, 'translation'),
+                "original": getattr(obj, 'original')
+            }
+        elif isinstance(obj, Subtitles):
             return {
                 "sourcepath": obj.sourcepath,
                 "outputpath": obj.outputpath,
                 "scenecount": len(obj.scenes),
-                "settings": getattr(obj, 'settings', {}),
+                "settings": { key : value for key, value in getattr(obj, 'settings', {}).items() if value is not None },
                 "metadata": getattr(obj, 'metadata', {}),
                 "terminology_map": obj.terminology_map,
                 "format": obj.file_format,
@@ -79,16 +100,6 @@ class SubtitleEncoder(json.JSONEncoder):
                 "translation": obj.translation,
                 "prompt": obj.prompt
             }
-        elif isinstance(obj, SubtitleLine):
-            return {
-                "index": obj._index,
-                "start": obj.start.total_seconds() if obj.start else None,
-                "end": obj.end.total_seconds() if obj.end else None,
-                "content": obj.content,
-                "metadata": getattr(obj, 'metadata'),
-                "translation": getattr(obj, 'translation'),
-                "original": getattr(obj, 'original')
-            }
         elif isinstance(obj, Translation):
             return {
                 "content": obj.content
@@ -117,7 +128,9 @@ def _object_hook(dct):
     # Reconstruct our custom types from JSON
     if '_class' in dct:
         class_name = dct.pop('_class')
-        if class_name in {classname(Subtitles), "SubtitleFile"}:      # Backward compatibility
+        if class_name in _line_class_names:
+            return SubtitleLine(dct)
+        elif class_name in _subtitles_class_names:
             sourcepath = dct.get('sourcepath')
             outpath = dct.get('outputpath') or dct.get('filename')
             obj = Subtitles(sourcepath, outpath)
@@ -128,15 +141,13 @@ def _object_hook(dct):
             obj.terminology_map = {str(k): str(v) for k, v in terminology.items()} if isinstance(terminology, dict) else {}
             obj.scenes = dct.get('scenes', [])
             return obj
-        elif class_name == classname(SubtitleScene):
+        elif class_name == _scene_class_name:
             obj = SubtitleScene(dct)
             return obj
-        elif class_name == classname(SubtitleBatch):
+        elif class_name == _batch_class_name:
             obj = SubtitleBatch(dct)
             return obj
-        elif class_name == classname(SubtitleLine) or class_name == "Subtitle": # TEMP backward compatibility
-            return SubtitleLine(dct)
-        elif class_name == classname(Translation) or class_name == "GPTTranslation":
+        elif class_name in _translation_class_names:
             content = dct.get('content') or {
                 'text' : dct.get('text'),
                 'finish_reason' : dct.get('finish_reason'),
@@ -159,7 +170,7 @@ def _object_hook(dct):
 
             obj = Translation(content)
             return obj
-        elif class_name == classname(TranslationPrompt):
+        elif class_name == _prompt_class_name:
             user_prompt = dct.get('user_prompt')
             conversation = dct.get('conversation')
             obj = TranslationPrompt(user_prompt, conversation)
@@ -168,9 +179,9 @@ def _object_hook(dct):
             obj.batch_prompt = dct.get('batch_prompt')
             obj.messages = dct.get('messages')
             return obj
-        elif class_name == classname(Color):
+        elif class_name == _color_class_name:
             return Color.from_hex(dct.get('hex', '#00000000'))
-        elif class_name == classname(TranslationError):
+        elif class_name == _error_class_name:
             return TranslationError(dct.get('message'))
 
     return dct
@@ -257,7 +257,9 @@ class SubtitleTranslator:
 
         # Ask the client to do the translation
         streaming_callback = self._create_streaming_callback(batch, line_numbers) if self.client.enable_streaming else None
-        translation : Translation|None = self.client.RequestTranslation(batch.prompt, streaming_callback=streaming_callback)
+        # Retranslating asks for a new response, so don't reuse a cached one
+        use_cache = not self.retranslate
+        translation : Translation|None = self.client.RequestTranslation(batch.prompt, streaming_callback=streaming_callback, use_cache=use_cache)
 
         if not self.aborted:
             if not translation:
@@ -275,10 +277,14 @@ class SubtitleTranslator:
             if not split_performed and batch.errors and translation.reached_token_limit:
                 logging.warning(_("Hit API token limit with errors, retrying batch without context..."))
                 batch.prompt.GenerateMessages(instructions, batch.originals, {})
-                translation = self.client.RequestTranslation(batch.prompt, streaming_callback=streaming_callback)
+                translation = self.client.RequestTranslation(batch.prompt, streaming_callback=streaming_callback, use_cache=use_cache)
                 if translation and not self.aborted:
                     self.ProcessBatchTranslation(batch, translation, line_numbers)
 
+            # Only responses that were complete and passed validation are reused for identical prompts
+            if translation and not split_performed and not batch.errors and not translation.reached_token_limit:
+                self.client.CacheTranslation(batch.prompt, translation)
+
             # Consider retrying if there were errors and no other recovery strategy was applied
             if not split_performed and batch.errors and self.retry_on_error:
                 logging.warning(_("Scene {scene} batch {batch} failed validation, requesting retranslation").format(scene=batch.scene, batch=batch.number))
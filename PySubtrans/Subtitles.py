@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from copy import deepcopy
+from bisect import bisect_left
+from operator import attrgetter
 import os
 import logging
 import threading
@@ -11,7 +12,7 @@ from PySubtrans.Options import Options
 from PySubtrans.SettingsType import SettingsType
 from PySubtrans.SubtitleBatch import SubtitleBatch
 from PySubtrans.SubtitleError import SubtitleError, SubtitleParseError
-from PySubtrans.Helpers import GetInputPath, GetOutputPath
+from PySubtrans.Helpers import GetInputPath, GetOutputPath, OpenFileForAtomicWrite
 from PySubtrans.SubtitleFileHandler import SubtitleFileHandler, default_encoding
 from PySubtrans.SubtitleFormatRegistry import SubtitleFormatRegistry
 from PySubtrans.SubtitleScene import SubtitleScene, UnbatchScenes
@@ -37,7 +38,8 @@ class Subtitles:
         self.file_format : str|None = None
         self.terminology_map : dict[str, str] = {}
 
-        self.settings : SettingsType = SettingsType(deepcopy(settings)) if settings else SettingsType()
+        # Clone settings so the subtitles can be modified independently, wrapping anything else only once
+        self.settings : SettingsType = settings.clone() if isinstance(settings, SettingsType) else SettingsType(settings)
 
     @property
     def has_subtitles(self) -> bool:
@@ -45,23 +47,24 @@ class Subtitles:
 
     @property
     def any_translated(self) -> bool:
-        with self.lock:
-            return any(scene.any_translated for scene in self.scenes) if self.scenes else False
+        # Read the list once so the result is consistent if scenes are replaced concurrently
+        scenes = self._scenes
+        return any(scene.any_translated for scene in scenes) if scenes else False
 
     @property
     def all_translated(self) -> bool:
-        with self.lock:
-            return all(scene.all_translated for scene in self.scenes) if self.scenes else False
+        scenes = self._scenes
+        return all(scene.all_translated for scene in scenes) if scenes else False
 
     @property
     def linecount(self) -> int:
-        with self.lock:
-            return len(self.originals) if self.originals else 0
+        originals = self.originals
+        return len(originals) if originals else 0
 
     @property
     def scenecount(self) -> int:
-        with self.lock:
-            return len(self.scenes) if self.scenes else 0
+        scenes = self._scenes
+        return len(scenes) if scenes else 0
 
     @property
     def scenes(self) -> list[SubtitleScene]:
@@ -78,11 +81,16 @@ class Subtitles:
         """
         Get a scene by number
         """
-        if not self.scenes:
+        # Read the list once rather than locking, as the scenes are replaced wholesale when they change
+        scenes = self._scenes
+        if not scenes:
             raise SubtitleError(_("Subtitles have not been batched"))
 
-        with self.lock:
-            matches = [ scene for scene in self.scenes if scene.number == scene_number ]
+        # Scenes are normally numbered sequentially from 1, so check the expected position first
+        if 0 < scene_number <= len(scenes) and scenes[scene_number - 1].number == scene_number:
+            return scenes[scene_number - 1]
+
+        matches = [ scene for scene in scenes if scene.number == scene_number ]
 
         if not matches:
             raise SubtitleError(f"Scene {scene_number} does not exist")
@@ -96,29 +104,29 @@ class Subtitles:
         """
         Get a batch by scene and batch number
         """
-        with self.lock:
-            scene = self.GetScene(scene_number)
-            for batch in scene.batches:
-                if batch.number == batch_number:
-                    return batch
+        scene = self.GetScene(scene_number)
+        batch = scene.GetBatch(batch_number)
 
-        raise SubtitleError(f"Scene {scene_number} batch {batch_number} doesn't exist")
+        if batch is None:
+            raise SubtitleError(f"Scene {scene_number} batch {batch_number} doesn't exist")
+
+        return batch
 
     def GetOriginalLine(self, line_number : int) -> SubtitleLine|None:
         """
         Get a line by number
         """
-        if self.originals:
-            with self.lock:
-                return next((line for line in self.originals if line.number == line_number), None)
+        originals = self.originals
+        if originals:
+            return self._find_line(originals, line_number)
 
     def GetTranslatedLine(self, line_number : int) -> SubtitleLine|None:
         """
         Get a translated line by number
         """
-        if self.translated:
-            with self.lock:
-                return next((line for line in self.translated if line.number == line_number), None)
+        translated = self.translated
+        if translated:
+            return self._find_line(translated, line_number)
 
     def GetBatchContainingLine(self, line_number: int) -> SubtitleBatch|None:
         """
@@ -127,17 +135,19 @@ class Subtitles:
         if not self.scenes:
             raise SubtitleError("Subtitles have not been batched yet")
 
-        for scene in self.scenes:
-            if scene.first_line_number is not None and scene.first_line_number > line_number:
-                break
+        # Scenes and batches are ordered by line number, so binary search for the first one ending at or after the line
+        scenes = self.scenes
+        scene_index = bisect_left(scenes, line_number, key=lambda scene: scene.last_line_number or 0)
+        if scene_index < len(scenes):
+            batches = scenes[scene_index].batches
+            batch_index = bisect_left(batches, line_number, key=lambda batch: batch.last_line_number or 0)
+            if batch_index < len(batches):
+                batch = batches[batch_index]
+                if batch.first_line_number is not None and batch.first_line_number <= line_number:
+                    return batch
 
-            if scene.last_line_number is None or scene.last_line_number >= line_number:
-                for batch in scene.batches:
-                    if batch.first_line_number is not None and batch.first_line_number > line_number:
-                        break
-
-                    if batch.last_line_number is None or batch.last_line_number >= line_number:
-                        return batch
+        # Fall back to a linear scan in case empty scenes or batches broke the ordering
+        return self._scan_for_batch_containing_line(line_number)
 
     def GetBatchesContainingLines(self, line_numbers : list[int]) -> list[SubtitleBatch]:
         """
@@ -151,39 +161,48 @@ class Subtitles:
 
         sorted_line_numbers = sorted(line_numbers)
 
-        next_line_index = 0
-        line_number_count = len(sorted_line_numbers)
+        scenes = self.scenes
+        scene_count = len(scenes)
+        scene_index = 0
+        batch_index = 0
         out_batches : list[SubtitleBatch] = []
 
-        for scene in self.scenes:
-            next_line_number = sorted_line_numbers[next_line_index]
-            if scene.last_line_number is None or scene.last_line_number < next_line_number:
+        for line_number in sorted_line_numbers:
+            # Line numbers are sorted, so consecutive lines usually fall in the batch that was just found
+            if out_batches and (out_batches[-1].last_line_number or 0) >= line_number:
                 continue
 
-            if scene.first_line_number is not None and scene.first_line_number > next_line_number:
-                raise SubtitleError(f"Line {next_line_number} not found in any scene")
-
-            for batch in scene.batches:
-                if batch.last_line_number is None or batch.last_line_number < next_line_number:
-                    continue
+            # Resume the binary search from the previous hit rather than rescanning from the start
+            found_scene_index = bisect_left(scenes, line_number, lo=scene_index, key=lambda scene: scene.last_line_number or 0)
+            if found_scene_index >= scene_count:
+                break
 
-                if batch.first_line_number is not None and batch.first_line_number > next_line_number:
-                    raise SubtitleError(f"Line {next_line_number} not found in any batch")
+            if found_scene_index != scene_index:
+                scene_index = found_scene_index
+                batch_index = 0
 
-                out_batches.append(batch)
+            scene = scenes[scene_index]
+            in_scene = scene.first_line_number is None or scene.first_line_number <= line_number
 
-                last_line_in_batch = batch.last_line_number
-                while next_line_index < line_number_count and last_line_in_batch >= sorted_line_numbers[next_line_index]:
-                    next_line_index += 1
+            batch = None
+            if in_scene:
+                batches = scene.batches
+                batch_index = bisect_left(batches, line_number, lo=batch_index, key=lambda batch: batch.last_line_number or 0)
+                batch = batches[batch_index] if batch_index < len(batches) else None
 
-                if next_line_index >= line_number_count:
-                    return out_batches
+            if batch is None or batch.first_line_number is None or batch.first_line_number > line_number:
+                # Empty scenes or batches can break the ordering, so fall back to a linear scan before giving up
+                batch = self._scan_for_batch_containing_line(line_number)
+                if batch is None or batch.first_line_number is None or batch.first_line_number > line_number:
+                    if not in_scene:
+                        raise SubtitleError(f"Line {line_number} not found in any scene")
+                    raise SubtitleError(f"Line {line_number} not found in any batch")
 
-                next_line_number = sorted_line_numbers[next_line_index]
+            if not out_batches or out_batches[-1] is not batch:
+                out_batches.append(batch)
 
         return out_batches
 
-
     def LoadSubtitles(self, filepath: str|None = None) -> None:
         """
         Load subtitles from a file
@@ -194,15 +213,18 @@ class Subtitles:
         if not self.sourcepath:
             raise ValueError("No source path set for subtitles")
 
+        file_format = SubtitleFormatRegistry.get_format_from_filename(self.sourcepath)
+
         try:
-            file_handler: SubtitleFileHandler = SubtitleFormatRegistry.create_handler(filename=self.sourcepath)
+            file_handler: SubtitleFileHandler = SubtitleFormatRegistry.create_handler(file_format, filename=self.sourcepath)
 
             data = file_handler.load_file(self.sourcepath)
 
         except SubtitleParseError as e:
             logging.debug(f"Error parsing file: {e}")
             logging.info(_("Error parsing file... attempting format detection"))
-            data = SubtitleFormatRegistry.detect_format_and_load_file(self.sourcepath)
+            # Don't reparse with the handler that just failed if detection agrees with the file extension
+            data = SubtitleFormatRegistry.detect_format_and_load_file(self.sourcepath, failed_format=file_format, failed_error=e)
 
         with self.lock:
             self._renumber_if_needed(data.lines)
@@ -240,9 +262,8 @@ class Subtitles:
             if originals:
                 file_handler = SubtitleFormatRegistry.create_handler(filename=path)
                 data = SubtitleData(lines=originals, metadata=self.metadata, start_line_number=self.start_line_number)
-                subtitle_file = file_handler.compose(data)
-                with open(path, 'w', encoding=default_encoding) as f:
-                    f.write(subtitle_file)
+                with OpenFileForAtomicWrite(path, default_encoding) as f:
+                    file_handler.write_to(data, f)
             else:
                 logging.warning(_("No original subtitles to save to {}").format(str(path)))
 
@@ -292,9 +313,9 @@ class Subtitles:
             # Apply RTL markers if requested (handler will decide format-specific implementation)
             data.metadata['add_rtl_markers'] = self.settings.get('add_right_to_left_markers', False)
 
-            subtitle_file = file_handler.compose(data)
-            with open(outputpath, 'w', encoding=default_encoding) as f:
-                f.write(subtitle_file)
+            # Write to a temporary file first, so a failed write cannot destroy an existing translation
+            with OpenFileForAtomicWrite(outputpath, default_encoding) as f:
+                file_handler.write_to(data, f)
 
             self.translated = translated
             self.outputpath = outputpath
@@ -309,23 +330,67 @@ class Subtitles:
         with self.lock:
             self.settings.update(settings)
 
+    def _find_line(self, lines : list[SubtitleLine], line_number : int) -> SubtitleLine|None:
+        """
+        Find a line by number, checking the position it would occupy if the lines are numbered sequentially before scanning
+        """
+        index = line_number - lines[0].number
+        if 0 <= index < len(lines) and lines[index].number == line_number:
+            return lines[index]
+
+        return next((line for line in lines if line.number == line_number), None)
+
+    def _scan_for_batch_containing_line(self, line_number : int) -> SubtitleBatch|None:
+        """
+        Find the batch containing a line number by scanning every scene and batch in order
+        """
+        for scene in self.scenes:
+            if scene.first_line_number is not None and scene.first_line_number > line_number:
+                break
+
+            if scene.last_line_number is None or scene.last_line_number >= line_number:
+                for batch in scene.batches:
+                    if batch.first_line_number is not None and batch.first_line_number > line_number:
+                        break
+
+                    if batch.last_line_number is None or batch.last_line_number >= line_number:
+                        return batch
+
+        return None
+
     def _renumber_if_needed(self, lines : list[SubtitleLine]|None) -> None:
         """
         Renumber subtitle lines if any have number 0 (indicating missing/invalid indices)
         """
-        if lines and any(line.number == 0 for line in lines):
+        # Line numbers are ints, so all() over the numbers finds a zero without a Python-level generator
+        if lines and not all(map(attrgetter('number'), lines)):
             logging.warning(_("Renumbering subtitle lines due to missing indices"))
             for line_number, line in enumerate(lines, start=1):
                 line.number = line_number
 
 
     def _merge_original_and_translated(self, originals: list[SubtitleLine], translated: list[SubtitleLine]) -> list[SubtitleLine]:
+        # Fast path for a complete translation, where every translated line matches the original at the same position
+        if len(originals) == len(translated) and all(original.key and original.key == item.key for original, item in zip(originals, translated)):
+            merged = [ self._merge_line(original, item) for original, item in zip(originals, translated) ]
+
+            # Sort by line number in case the originals are out of order, which is linear if they are not
+            return sorted(merged, key=lambda item: item.key)
+
         lines = {item.key: SubtitleLine(item) for item in originals if item.key}
 
         for item in translated:
-            if item.key in lines:
-                line = lines[item.key]
+            line = lines.get(item.key)
+            if line is not None:
                 line.text = f"{line.text}\n{item.text}"
 
         return sorted(lines.values(), key=lambda item: item.key)
 
+    def _merge_line(self, original : SubtitleLine, translated : SubtitleLine) -> SubtitleLine:
+        """
+        Create a copy of the original line with the translated text appended
+        """
+        line = SubtitleLine(original)
+        line.text = f"{original.text}\n{translated.text}"
+        return line
+
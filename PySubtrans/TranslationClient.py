@@ -1,5 +1,9 @@
+from collections import OrderedDict
+from collections.abc import Callable
 import logging
+import threading
 import time
+from typing import Any
 
 from PySubtrans.Instructions import DEFAULT_TASK_TYPE
 from PySubtrans.Options import Options, SettingsType
@@ -18,63 +22,90 @@ class TranslationClient:
     """
     Handles communication with the translation provider
     """
+    RESPONSE_CACHE_SIZE : int = 128
+
     def __init__(self, settings : SettingsType):
         if isinstance(settings, Options):
             settings = settings.GetSettings()
 
         self.settings: SettingsType = SettingsType(settings)
+
+        # Resolve frequently read settings once rather than coercing them on every access
+        self._supports_conversation: bool = self.settings.get_bool('supports_conversation', False)
+        self._supports_system_prompt: bool = self.settings.get_bool('supports_system_prompt', False)
+        self._supports_system_messages: bool = self.settings.get_bool('supports_system_messages', False)
+        self._supports_system_messages_for_retry: bool = self.settings.get_bool('supports_system_messages_for_retry', self._supports_system_messages)
+        self._supports_streaming: bool = self.settings.get_bool('supports_streaming', False)
+        self._system_role: str = self.settings.get_str('system_role') or "system"
+        self._prompt_template: str = self.settings.get_str('prompt_template') or default_prompt_template
+        self._rate_limit: float|None = self.settings.get_float('rate_limit')
+        self._temperature: float = self.settings.get_float('temperature') or 0.0
+        self._max_retries: int = self.settings.get_int('max_retries') or 3
+        self._backoff_time: float = self.settings.get_float('backoff_time') or 5.0
+
         self.instructions: str|None = settings.get_str('instructions')
         self.retry_instructions: str|None = settings.get_str('retry_instructions')
         self.enable_streaming: bool = settings.get_bool('stream_responses', False) and self.supports_streaming
         self.aborted: bool = False
         self.events: TranslationEvents|None = None
+        self._next_request_time: float = 0.0
+
+        # Optional cache of accepted responses to identical prompts, only used if explicitly enabled.
+        # Least recently used responses are discarded once the cache is full.
+        self._response_cache: OrderedDict[tuple[str, float], Translation]|None = OrderedDict() if settings.get_bool('cache_responses', False) else None
+        self._response_cache_lock = threading.RLock()
+
+        # Message emitters, routed to the translation events once they are attached
+        self._emit_error_fn: Callable[[str], Any] = logging.error
+        self._emit_warning_fn: Callable[[str], Any] = logging.warning
+        self._emit_info_fn: Callable[[str], Any] = logging.info
 
         if not self.instructions:
             raise TranslationError("No instructions provided for the translator")
 
     @property
     def supports_conversation(self) -> bool:
-        return self.settings.get_bool('supports_conversation', False)
+        return self._supports_conversation
 
     @property
     def supports_system_prompt(self) -> bool:
-        return self.settings.get_bool('supports_system_prompt', False)
+        return self._supports_system_prompt
 
     @property
     def supports_system_messages(self) -> bool:
-        return self.settings.get_bool('supports_system_messages', False)
+        return self._supports_system_messages
 
     @property
     def supports_system_messages_for_retry(self) -> bool:
-        return self.settings.get_bool('supports_system_messages_for_retry', self.supports_system_messages)
+        return self._supports_system_messages_for_retry
 
     @property
     def system_role(self) -> str:
-        return self.settings.get_str('system_role') or "system"
+        return self._system_role
 
     @property
     def prompt_template(self) -> str:
-        return self.settings.get_str('prompt_template') or default_prompt_template
+        return self._prompt_template
 
     @property
     def rate_limit(self) -> float|None:
-        return self.settings.get_float('rate_limit')
+        return self._rate_limit
 
     @property
     def temperature(self) -> float:
-        return self.settings.get_float('temperature') or 0.0
+        return self._temperature
 
     @property
     def max_retries(self) -> int:
-        return self.settings.get_int('max_retries') or 3
+        return self._max_retries
 
     @property
     def backoff_time(self) -> float:
-        return self.settings.get_float('backoff_time') or 5.0
+        return self._backoff_time
 
     @property
     def supports_streaming(self) -> bool:
-        return self.settings.get_bool('supports_streaming', False)
+        return self._supports_streaming
 
     def BuildTranslationPrompt(self, user_prompt : str, instructions : str, lines : list[SubtitleLine], context : dict) -> TranslationPrompt:
         """
@@ -89,18 +120,33 @@ class TranslationClient:
         prompt.GenerateMessages(instructions, lines, context)
         return prompt
 
-    def RequestTranslation(self, prompt : TranslationPrompt, temperature : float|None = None, streaming_callback : StreamingCallback = None) -> Translation|None:
-        """
-        Generate the messages to request a translation
+    def RequestTranslation(self, prompt : TranslationPrompt, temperature : float|None = None, streaming_callback : StreamingCallback = None, use_cache : bool = True) -> Translation|None:
         """
-        start_time = time.monotonic()
+        Generate the messages to request a translation.
 
+        If response caching is enabled, a response previously stored with CacheTranslation for an identical prompt is reused,
+        unless use_cache is False.
+        """
         if self.aborted:
             return None
 
         # Create a translation request to encapsulate the operation
         request = TranslationRequest(prompt, streaming_callback)
 
+        # Cached responses do not touch the provider, so check before waiting for the rate limit
+        cached_translation = self._get_cached_translation(prompt, temperature) if use_cache else None
+        if cached_translation:
+            logging.debug("Reusing response to an identical prompt")
+            if streaming_callback:
+                streaming_callback(cached_translation)
+            return cached_translation
+
+        # If a rate limit is specified, wait until the next request is allowed
+        self._wait_for_rate_limit()
+
+        if self.aborted:
+            return None
+
         # Perform the translation
         translation = self._request_translation(request, temperature)
 
@@ -110,18 +156,22 @@ class TranslationClient:
         if translation.text:
             logging.debug(f"Response:\n{translation.text}")
 
-        # If a rate limit is replied ensure a minimum duration for each request
-        rate_limit = self.rate_limit
-        if rate_limit and rate_limit > 0.0:
-            minimum_duration = 60.0 / rate_limit
+        return translation
 
-            elapsed_time = time.monotonic() - start_time
-            if elapsed_time < minimum_duration:
-                sleep_time = minimum_duration - elapsed_time
-                logging.debug(f"Sleeping for {sleep_time:.2f} seconds to respect rate limit")
-                time.sleep(sleep_time)
+    def CacheTranslation(self, prompt : TranslationPrompt, translation : Translation, temperature : float|None = None) -> None:
+        """
+        Store an accepted response so that identical prompts can reuse it, if response caching is enabled.
+        The least recently used responses are discarded when the cache is full.
+        """
+        if self._response_cache is None or not translation.text:
+            return
 
-        return translation
+        key = self._response_cache_key(prompt, temperature)
+        with self._response_cache_lock:
+            self._response_cache[key] = Translation(dict(translation.content))
+            self._response_cache.move_to_end(key)
+            while len(self._response_cache) > self.RESPONSE_CACHE_SIZE:
+                self._response_cache.popitem(last=False)
 
     def GetParser(self, task_type: str = DEFAULT_TASK_TYPE) -> TranslationParser:
         """
@@ -139,24 +189,57 @@ class TranslationClient:
         Attach translation events to use for  log messages.
         """
         self.events = events
+        self._emit_error_fn = lambda message: events.error.send(self, message=message)
+        self._emit_warning_fn = lambda message: events.warning.send(self, message=message)
+        self._emit_info_fn = lambda message: events.info.send(self, message=message)
 
     def _emit_error(self, message : str) -> None:
-        if self.events:
-            self.events.error.send(self, message=message)
-        else:
-            logging.error(message)
+        self._emit_error_fn(message)
 
     def _emit_warning(self, message : str) -> None:
-        if self.events:
-            self.events.warning.send(self, message=message)
-        else:
-            logging.warning(message)
+        self._emit_warning_fn(message)
 
     def _emit_info(self, message : str) -> None:
-        if self.events:
-            self.events.info.send(self, message=message)
-        else:
-            logging.info(message)
+        self._emit_info_fn(message)
+
+    def _wait_for_rate_limit(self) -> None:
+        """
+        Space requests at least 60/rate_limit seconds apart, sleeping only if the previous request was too recent
+        """
+        rate_limit = self.rate_limit
+        if not rate_limit or rate_limit <= 0.0:
+            return
+
+        now = time.monotonic()
+        if now < self._next_request_time:
+            sleep_time = self._next_request_time - now
+            logging.debug(f"Sleeping for {sleep_time:.2f} seconds to respect rate limit")
+            time.sleep(sleep_time)
+            now = self._next_request_time
+
+        self._next_request_time = now + 60.0 / rate_limit
+
+    def _response_cache_key(self, prompt : TranslationPrompt, temperature : float|None) -> tuple[str, float]:
+        """
+        Identify a response by the prompt content and the temperature it was requested at
+        """
+        return (prompt.content_hash, temperature if temperature is not None else self.temperature)
+
+    def _get_cached_translation(self, prompt : TranslationPrompt, temperature : float|None) -> Translation|None:
+        """
+        Return a copy of a cached response to an identical prompt, if response caching is enabled and there is one
+        """
+        if self._response_cache is None:
+            return None
+
+        key = self._response_cache_key(prompt, temperature)
+        with self._response_cache_lock:
+            cached = self._response_cache.get(key)
+            if cached is None:
+                return None
+            self._response_cache.move_to_end(key)
+
+        return Translation(dict(cached.content))
 
     def _request_translation(self, request: TranslationRequest, temperature: float|None = None) -> Translation|None:
         """
@@ -1,7 +1,7 @@
 import logging
 from blinker import Signal
 from dataclasses import dataclass, field
-from typing import Protocol
+from typing import Any, Protocol
 
 
 class LoggerProtocol(Protocol):
@@ -11,6 +11,23 @@ class LoggerProtocol(Protocol):
     def info(self, msg : object, *args, **kwargs) -> None: ...
 
 
+class _LoggerAdapter:
+    """
+    Adapts signal keyword arguments to a logger's positional arguments
+    """
+    def __init__(self, logger : LoggerProtocol):
+        self.logger = logger
+
+    def error(self, sender : Any, message : str) -> None:
+        self.logger.error(message)
+
+    def warning(self, sender : Any, message : str) -> None:
+        self.logger.warning(message)
+
+    def info(self, sender : Any, message : str) -> None:
+        self.logger.info(message)
+
+
 @dataclass
 class TerminologyUpdate:
     """Payload for the ``terminology_updated`` event."""
@@ -81,6 +98,9 @@ class TranslationEvents:
         self._default_warning_wrapper = lambda sender, message: logging.warning(message)
         self._default_info_wrapper = lambda sender, message: logging.info(message)
 
+        # Adapters for custom loggers, kept so that they can be disconnected
+        self._logger_adapters : dict[LoggerProtocol, _LoggerAdapter] = {}
+
     def connect_default_loggers(self):
         """
         Connect default logging handlers to logging signals.
@@ -100,21 +120,33 @@ class TranslationEvents:
     def connect_logger(self, logger : LoggerProtocol):
         """
         Connect a custom logger to the logging signals.
+        Connecting the same logger more than once has no additional effect.
 
         Args:
             logger: A logger-like object with error, warning, and info methods
         """
-        # Create wrapper functions to adapt signal kwargs to logger positional args
-        def error_wrapper(sender, message):
-            logger.error(message)
+        if logger in self._logger_adapters:
+            return
+
+        adapter = _LoggerAdapter(logger)
+        self._logger_adapters[logger] = adapter
+
+        # Use weak=False so the adapter's bound methods are not garbage collected
+        self.error.connect(adapter.error, weak=False)
+        self.warning.connect(adapter.warning, weak=False)
+        self.info.connect(adapter.info, weak=False)
 
-        def warning_wrapper(sender, message):
-            logger.warning(message)
+    def disconnect_logger(self, logger : LoggerProtocol):
+        """
+        Disconnect a custom logger from the logging signals.
 
-        def info_wrapper(sender, message):
-            logger.info(message)
+        Args:
+            logger: A logger previously passed to connect_logger
+        """
+        adapter = self._logger_adapters.pop(logger, None)
+        if adapter is None:
+            return
 
-        # Use weak=False to prevent garbage collection of closures
-        self.error.connect(error_wrapper, weak=False)
-        self.warning.connect(warning_wrapper, weak=False)
-        self.info.connect(info_wrapper, weak=False)
+        self.error.disconnect(adapter.error)
+        self.warning.disconnect(adapter.warning)
+        self.info.disconnect(adapter.info)
@@ -1,3 +1,4 @@
+import hashlib
 from typing import Any
 
 from PySubtrans.Helpers.Localization import _
@@ -46,6 +47,14 @@ class TranslationPrompt:
         self.content: str|list[str]|list[dict[str, str]]|None = None
         self.messages: list[dict[str, str]] = []
 
+    @property
+    def content_hash(self) -> str:
+        """
+        Digest identifying the system prompt and content that will be sent to the provider
+        """
+        content = repr((self.system_prompt, self.content))
+        return hashlib.blake2b(content.encode('utf-8'), digest_size=16).hexdigest()
+
     def GenerateMessages(self, instructions: str, lines: list[SubtitleLine], context: dict[str, Any]) -> None:
         """
         Generate the messages to request translation of a batch of subtitles
@@ -1,12 +1,29 @@
+import hashlib
+import time
+from collections.abc import Mapping
+from types import MappingProxyType
 from typing import cast
-from PySubtrans.Options import Options, SettingsType
+from PySubtrans.Options import Options
 from PySubtrans.SettingsType import GuiSettingsType, SettingsType
 from PySubtrans.TranslationClient import TranslationClient
 
+# Model lists shared across provider instances, holding the most recent list for each provider
+_MODELS_CACHE : dict[str, tuple[tuple[str, ...], float, list[str]]] = {}
+
+# Settings that identify the server a provider fetches its model list from
+_MODELS_SERVER_SETTINGS = ['api_base', 'server_address', 'server_url', 'aws_region']
+
+# Credentials used to fetch the model list, which are only stored in the cache as a hash
+_MODELS_CREDENTIAL_SETTINGS = ['api_key', 'access_key', 'secret_access_key']
+
 class TranslationProvider:
     """
     Base class for translation service providers.
     """
+    _providers_cache : dict|None = None
+    _providers_by_casefold : dict = {}
+    MODELS_CACHE_TTL : float = 24 * 60 * 60
+
     def __init__(self, name : str, settings : SettingsType):
         self.name : str = name
         self.settings : SettingsType = settings
@@ -20,7 +37,14 @@ class TranslationProvider:
         list of available models for the provider
         """
         if not self._available_models:
-            self._available_models = self.GetAvailableModels()
+            cache_key = self._models_cache_key()
+            cached = _MODELS_CACHE.get(self.name)
+            if cached and cached[0] == cache_key and time.monotonic() - cached[1] < self.MODELS_CACHE_TTL:
+                self._available_models = list(cached[2])
+            else:
+                self._available_models = self.GetAvailableModels()
+                if self._available_models:
+                    _MODELS_CACHE[self.name] = (cache_key, time.monotonic(), list(self._available_models))
 
         return self._available_models
 
@@ -57,6 +81,7 @@ class TranslationProvider:
         Reset the available models for the provider
         """
         self._available_models = []
+        _MODELS_CACHE.pop(self.name, None)
 
     def GetInformation(self) -> str|None:
         """
@@ -86,42 +111,65 @@ class TranslationProvider:
         """
         Update the settings for the provider
         """
-        if isinstance(settings, Options):
-            options = cast(Options, settings)
+        if isinstance(options := settings, Options):
             options.InitialiseProviderSettings(self.name, self.settings)
             settings = options.provider_settings[self.name]
 
-        # Update the settings
-        for k, v in settings.items():
-            if k in self.settings:
-                self.settings[k] = v
+        # Update only the settings this provider recognises
+        for k in settings.keys() & self.settings.keys():
+            self.settings[k] = settings[k]
 
     def GetCombinedSettings(self, overrides : SettingsType) -> SettingsType:
         """
         Merge saved settings with default settings to ensure all keys are present
         """
-        combined_settings = SettingsType(self.settings.copy())
+        combined_settings = SettingsType(self.settings)
         combined_settings.update(overrides)
         return combined_settings
 
+    def _models_cache_key(self) -> tuple[str, ...]:
+        """
+        Key identifying the server and credentials the model list was fetched with
+        """
+        server = next((value for key in _MODELS_SERVER_SETTINGS if (value := self.settings.get_str(key))), '')
+        credentials = '\n'.join(self.settings.get_str(key) or '' for key in _MODELS_CREDENTIAL_SETTINGS)
+        return (server, hashlib.sha256(credentials.encode('utf-8')).hexdigest())
+
     def _allow_multithreaded_translation(self) -> bool:
         """
         Returns True if the provider supports multithreaded translation
         """
         return False
 
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # A provider has been defined or redefined, so the cached dictionary is out of date
+        TranslationProvider.ResetProvidersCache()
+
     @classmethod
-    def get_providers(cls) -> dict:
+    def get_providers(cls) -> Mapping[str, type['TranslationProvider']]:
         """
-        Return a dictionary of all available providers
+        Return a read-only mapping of all available providers
         """
-        if not cls.__subclasses__():
-            # Import the providers package, which will trigger explicit imports
-            from . import Providers  # type: ignore[ignore-unused]
+        if TranslationProvider._providers_cache is None:
+            subclasses = TranslationProvider.__subclasses__()
+            if not subclasses:
+                # Import the providers package, which will trigger explicit imports
+                from . import Providers  # type: ignore[ignore-unused]
+                subclasses = TranslationProvider.__subclasses__()
+
+            TranslationProvider._providers_cache = { cast(TranslationProvider, provider).name : provider for provider in subclasses }
+            TranslationProvider._providers_by_casefold = { name.casefold() : provider for name, provider in TranslationProvider._providers_cache.items() }
 
-        providers = { cast(TranslationProvider, provider).name : provider for provider in cls.__subclasses__() }
+        return MappingProxyType(TranslationProvider._providers_cache)
 
-        return providers
+    @classmethod
+    def ResetProvidersCache(cls) -> None:
+        """
+        Discard the cached provider dictionary so that it is rebuilt on next access
+        """
+        TranslationProvider._providers_cache = None
+        TranslationProvider._providers_by_casefold = {}
 
     @classmethod
     def get_provider(cls, options : Options):
@@ -148,13 +196,12 @@ class TranslationProvider:
 
     @classmethod
     def create_provider(cls, name, provider_settings):
-        providers = cls.get_providers().items()
-        name_cf = name.casefold()
-        for provider_name, provider in providers:
-            if provider_name.casefold() == name_cf:
-                return provider(provider_settings)
+        providers = cls.get_providers()
+        provider = providers.get(name) or TranslationProvider._providers_by_casefold.get(name.casefold())
+        if provider is None:
+            raise ValueError(f"Unknown translation provider: {name}")
 
-        raise ValueError(f"Unknown translation provider: {name}")
+        return provider(provider_settings)
 
 
     @classmethod
@@ -1,67 +1,118 @@
 from collections.abc import Callable
-from typing import Any, TypeAlias
+from typing import Any, Literal, TypeAlias
 from PySubtrans.TranslationPrompt import TranslationPrompt
 from PySubtrans.Translation import Translation
 
 StreamingCallback: TypeAlias = Callable[[Translation], None]|None
+StreamingEmitMode: TypeAlias = Literal['delta', 'cumulative']
 
 class TranslationRequest:
     """
-    Encapsulates a translation request with its prompt, callback, and tracking data
+    Encapsulates a translation request with its prompt, callback, and tracking data.
+
+    Streaming callbacks receive the complete line groups added since the previous update by default,
+    or all the complete line groups received so far if emit_mode is 'cumulative'.
     """
-    def __init__(self, prompt : TranslationPrompt, streaming_callback : StreamingCallback = None):
+    __slots__ = ('prompt', 'streaming_callback', 'emit_mode', '_chunks', '_length', '_last_char',
+                 '_last_double_newline', 'last_processed_pos', 'context')
+
+    def __init__(self, prompt : TranslationPrompt, streaming_callback : StreamingCallback = None, emit_mode : StreamingEmitMode = 'delta'):
         self.prompt : TranslationPrompt = prompt
         self.streaming_callback : StreamingCallback = streaming_callback
+        self.emit_mode : StreamingEmitMode = emit_mode
 
-        # Progress tracking
-        self.accumulated_text : str = ""
+        # Progress tracking - deltas are buffered as chunks and only joined when the text is needed
+        self._chunks : list[str] = []
+        self._length : int = 0
+        self._last_char : str = ""
+        self._last_double_newline : int = -1
         self.last_processed_pos : int = 0
 
-        # Additional context storage
-        self.context : dict[str, Any] = {}
+        # Additional context storage, only allocated if something is stored
+        self.context : dict[str, Any]|None = None
 
     @property
     def is_streaming(self) -> bool:
         """Check if this is a streaming request"""
         return self.streaming_callback is not None
 
+    @property
+    def accumulated_text(self) -> str:
+        """The complete text received so far"""
+        if len(self._chunks) > 1:
+            self._chunks = [''.join(self._chunks)]
+        return self._chunks[0] if self._chunks else ""
+
     def ProcessStreamingDelta(self, delta_text : str) -> None:
         """Process a streaming delta and emit partial updates for complete sections"""
-        if delta_text:
-            self.accumulated_text += delta_text
+        if not delta_text:
+            return
+
+        # Track the position of the last blank line as text arrives, checking only the new text
+        # and whether a blank line spans the boundary with the previous delta.
+        # This is done even without a callback, since one may be assigned after streaming starts.
+        index = delta_text.rfind('\n\n')
+        if index != -1:
+            self._last_double_newline = self._length + index
+        elif self._last_char == '\n' and delta_text[0] == '\n':
+            self._last_double_newline = self._length - 1
+
+        self._chunks.append(delta_text)
+        self._length += len(delta_text)
+        self._last_char = delta_text[-1]
 
         # Check for complete line groups (blank line threshold)
-        if self._has_complete_line_group():
+        if self.streaming_callback is not None and self._has_complete_line_group():
             self._emit_partial_update()
 
     def StoreContext(self, key : str, value : Any) -> None:
         """Store additional context data"""
+        if self.context is None:
+            self.context = {}
         self.context[key] = value
 
     def GetContext(self, key : str, default : Any = None) -> Any:
         """Retrieve context data"""
-        return self.context.get(key, default)
+        return default if self.context is None else self.context.get(key, default)
 
     def _has_complete_line_group(self) -> bool:
         """Check if there's a complete line group since last processed position"""
-        new_content = self.accumulated_text[self.last_processed_pos:]
-        return '\n\n' in new_content
+        return self._last_double_newline >= self.last_processed_pos
 
     def _emit_partial_update(self) -> None:
         """Emit partial update for complete sections and mark them as processed"""
         if not self.streaming_callback:
             return
 
-        # Find the last complete line group
-        last_double_newline = self.accumulated_text.rfind('\n\n')
-        if last_double_newline == -1:
+        # The end of the last complete line group is already known, so no need to search for it
+        last_double_newline = self._last_double_newline
+        if last_double_newline < self.last_processed_pos:
             return
 
-        # Extract complete section and emit update
-        complete_section = self.accumulated_text[:last_double_newline + 2]
-        if complete_section.strip():
+        # Extract the newly completed section (or everything up to it) and emit update
+        if self.emit_mode == 'cumulative':
+            complete_section = self.accumulated_text[:last_double_newline + 2]
+        else:
+            complete_section = self._text_since(self.last_processed_pos)[:last_double_newline + 2 - self.last_processed_pos]
+        if complete_section and not complete_section.isspace():
             partial_translation = Translation({'text': complete_section})
             self.streaming_callback(partial_translation)
 
         # Mark as processed
         self.last_processed_pos = last_double_newline + 2
+
+    def _text_since(self, position : int) -> str:
+        """Text received from position onward, joining only the chunks that cover it"""
+        needed = self._length - position
+        taken = 0
+        count = 0
+        for chunk in reversed(self._chunks):
+            if taken >= needed:
+                break
+            taken += len(chunk)
+            count += 1
+
+        if not count:
+            return ""
+
+        return ''.join(self._chunks[-count:])[taken - needed:]
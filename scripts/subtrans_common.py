@@ -179,6 +179,7 @@ def CreateArgParser(description : str) -> ArgumentParser:
     parser.add_argument('--list-formats', action='store_true', help="List supported subtitle formats and exit")
     parser.add_argument('-l', '--target-language', type=str, default=None, help="The target language for the translation")
     parser.add_argument('--batchthreshold', type=float, default=None, help="Number of seconds between lines to consider for batching")
+    parser.add_argument('--cacheresponses', action='store_true', default=None, help="Reuse the response to an identical request instead of sending it again")
     parser.add_argument('--debug', action='store_true', help="Run with DEBUG log level")
     parser.add_argument('--verbose', action='store_true', help="Log detailed progress and token usage for each batch")
     parser.add_argument('--description', type=str, default=None, help="A brief description of the film to give context")
@@ -252,6 +253,7 @@ def CreateOptions(args: Namespace, provider: str, **kwargs) -> Options:
         'retranslate': args.retranslate,
         'reload': args.reload,
         'rate_limit': args.ratelimit,
+        'cache_responses': args.cacheresponses,
         'proxy': getattr(args, 'proxy', None),
         'scene_threshold': args.scenethreshold,
         'substitutions': Substitutions.Parse(args.substitution),
@@ -121,6 +121,11 @@ class ChineseDinnerTests(SubtitleTestCase):
             first_line = scene.originals[0]
             self.assertLoggedEqual("First line", first_lines[i], first_line.text)
 
+        containing_lines = [location[0] for location in batch_containing_line]
+        expected_batches = list(dict.fromkeys((location[1], location[2]) for location in batch_containing_line))
+        batches = subtitles.GetBatchesContainingLines(containing_lines)
+        self.assertLoggedEqual("Batches containing lines", expected_batches, [(batch.scene, batch.number) for batch in batches])
+
         for line_number, scene_number, batch_number in batch_containing_line:
             batch = subtitles.GetBatchContainingLine(line_number)
 
@@ -740,6 +740,21 @@ class TestSettingsType(LoggedTestCase):
             self.assertIn('new_key', direct_nested)
             self.assertLoggedEqual("nested update visible in direct access", 'new_value', direct_nested['new_key'])
 
+    def test_clone(self):
+        """Test SettingsType.clone produces an independent copy"""
+        clone = self.test_settings.clone()
+        self.assertLoggedIsInstance("clone is SettingsType", clone, SettingsType)
+        self.assertLoggedEqual("clone matches original", dict(self.test_settings), dict(clone))
+
+        clone_list = clone.get_str_list('str_list')
+        clone_list.append('date')
+        self.assertLoggedEqual("original list unchanged", ['apple', 'banana', 'cherry'], self.test_settings.get_str_list('str_list'))
+
+        clone_dict = clone.get_dict('nested_dict')
+        self.assertLoggedIsInstance("nested clone is SettingsType", clone_dict, SettingsType)
+        clone_dict['inner_str'] = 'changed'
+        self.assertLoggedEqual("original nested dict unchanged", 'nested_value', self.test_settings.get_dict('nested_dict').get_str('inner_str'))
+
     def test_provider_settings_nested_updates(self):
         """Test that provider_settings properly handles nested updates"""
         
@@ -235,6 +235,54 @@ class StreamingTests(SubtitleTestCase):
         self.assertIn("Hoshino, ordering the usual", final_response)
 
 
+    def test_line_group_split_across_deltas(self):
+        """Test that a blank line split between two deltas is detected as a line group boundary"""
+        partial_updates : list[Translation] = []
+        request = TranslationRequest(TranslationPrompt("Test prompt", True), partial_updates.append)
+
+        request.ProcessStreamingDelta("#1\nTranslation>\nFirst line\n")
+        self.assertLoggedEqual("updates before boundary", 0, len(partial_updates))
+
+        request.ProcessStreamingDelta("\n#2\nTranslation>\nSecond")
+        self.assertLoggedEqual("updates after boundary", 1, len(partial_updates))
+        self.assertLoggedEqual("partial update text", "#1\nTranslation>\nFirst line", partial_updates[0].text)
+
+        request.ProcessStreamingDelta(" line\n")
+        self.assertLoggedEqual("no update without a new boundary", 1, len(partial_updates))
+        self.assertLoggedEqual("accumulated text", "#1\nTranslation>\nFirst line\n\n#2\nTranslation>\nSecond line\n", request.accumulated_text)
+
+    def test_callback_assigned_after_streaming_starts(self):
+        """Test that line groups received before the callback was assigned are still emitted"""
+        partial_updates : list[Translation] = []
+        request = TranslationRequest(TranslationPrompt("Test prompt", True))
+
+        request.ProcessStreamingDelta("#1\nTranslation>\nFirst line\n\n#2\n")
+
+        request.streaming_callback = partial_updates.append
+        request.ProcessStreamingDelta("Translation>\nSecond line\n")
+        self.assertLoggedEqual("updates after assigning callback", 1, len(partial_updates))
+        self.assertLoggedEqual("earlier line group is emitted", "#1\nTranslation>\nFirst line", partial_updates[0].text)
+
+        request.ProcessStreamingDelta("\n")
+        self.assertLoggedEqual("updates after next boundary", 2, len(partial_updates))
+        self.assertLoggedEqual("next line group is emitted", "#2\nTranslation>\nSecond line", partial_updates[1].text)
+
+    def test_partial_update_emit_modes(self):
+        """Test that delta mode emits only new line groups while cumulative mode emits everything so far"""
+        delta_updates : list[Translation] = []
+        cumulative_updates : list[Translation] = []
+        delta_request = TranslationRequest(TranslationPrompt("Test prompt", True), delta_updates.append)
+        cumulative_request = TranslationRequest(TranslationPrompt("Test prompt", True), cumulative_updates.append, emit_mode='cumulative')
+
+        for delta in ["#1\nTranslation>\nFirst line\n\n", "#2\nTranslation>\nSecond line\n\n"]:
+            delta_request.ProcessStreamingDelta(delta)
+            cumulative_request.ProcessStreamingDelta(delta)
+
+        self.assertLoggedEqual("delta update count", 2, len(delta_updates))
+        self.assertLoggedEqual("second delta update", "#2\nTranslation>\nSecond line", delta_updates[1].text)
+        self.assertLoggedEqual("cumulative update count", 2, len(cumulative_updates))
+        self.assertLoggedEqual("second cumulative update", "#1\nTranslation>\nFirst line\n\n#2\nTranslation>\nSecond line", cumulative_updates[1].text)
+
 
     @skip_if_debugger_attached
     def test_network_interruption_handling(self):
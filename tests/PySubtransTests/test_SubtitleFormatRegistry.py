@@ -1,8 +1,11 @@
+import functools
 import os
 import tempfile
 import unittest
-from typing import TextIO
-from unittest.mock import MagicMock, patch
+from collections.abc import Callable
+from typing import Any, TextIO
+
+import pysubs2
 
 from PySubtrans.SubtitleFileHandler import SubtitleFileHandler
 from PySubtrans.SubtitleFormatRegistry import SubtitleFormatRegistry
@@ -16,37 +19,176 @@ from PySubtrans.Helpers.Tests import (
 )
 
 
-class DummySrtHandler(SubtitleFileHandler):
-    SUPPORTED_EXTENSIONS = {'.srt': 5}
+@functools.lru_cache(maxsize=8)
+def _stub_srt_handler(priority : int) -> type[SubtitleFileHandler]:
+    """ Build a stub .srt handler with the given priority, reusing it for repeated requests """
+    class StubSrtHandler(SubtitleFileHandler):
+        SUPPORTED_EXTENSIONS = {'.srt': priority}
+
+        def parse_file(self, file_obj : TextIO) -> SubtitleData:
+            return SubtitleData(lines=[], metadata={})
+
+        def parse_string(self, content : str) -> SubtitleData:
+            return SubtitleData(lines=[], metadata={})
+
+        def compose(self, data : SubtitleData) -> str:
+            return ""
+
+        def load_file(self, path: str) -> SubtitleData:
+            return self.parse_string("")
+
+    StubSrtHandler.__name__ = StubSrtHandler.__qualname__ = f"StubSrtHandler{priority}"
+    return StubSrtHandler
+
+DummySrtHandler = _stub_srt_handler(5)
+
+
+SRT_CONTENT = "1\n00:00:01,000 --> 00:00:02,000\nTest subtitle\n\n2\n00:00:03,000 --> 00:00:04,000\nAnother line\n"
+
+ASS_CONTENT = """[Script Info]
+Title: Test
+ScriptType: v4.00+
+
+[V4+ Styles]
+Format: Name, Fontname, Fontsize, PrimaryColor, SecondaryColor, OutlineColor, BackColor, Bold, Italic, Underline, StrikeOut, ScaleX, ScaleY, Spacing, Angle, BorderStyle, Outline, Shadow, Alignment, MarginL, MarginR, MarginV, Encoding
+Style: Default,Arial,20,&H00FFFFFF,&H000000FF,&H00000000,&H80000000,0,0,0,0,100,100,0,0,1,2,0,2,10,10,10,1
+
+[Events]
+Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
+Dialogue: 0,0:00:01.00,0:00:02.00,Default,,0,0,0,,Test subtitle
+Dialogue: 0,0:00:03.00,0:00:04.00,Default,,0,0,0,,Another line
+"""
+
+SSA_CONTENT = """[Script Info]
+Title: Test SSA
+ScriptType: v4.00
+
+[V4 Styles]
+Format: Name, Fontname, Fontsize, PrimaryColor, SecondaryColor, TertiaryColor, BackColor, Bold, Italic, BorderStyle, Outline, Shadow, Alignment, MarginL, MarginR, MarginV, AlphaLevel, Encoding
+Style: Default,Arial,20,65535,255,0,0,0,0,1,2,0,2,10,10,10,0,1
+
+[Events]
+Format: Marked, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
+Dialogue: Marked=0,0:00:01.00,0:00:02.00,Default,,0,0,0,,Test subtitle
+Dialogue: Marked=0,0:00:03.00,0:00:04.00,Default,,0,0,0,,Another line
+"""
+
+# SRT content with non-ASCII characters (French accents)
+SRT_ACCENTED_CONTENT = "1\n00:00:01,000 --> 00:00:02,000\nCafé à Paris\n\n2\n00:00:03,000 --> 00:00:04,000\nHôtel très cher\n"
 
-    def parse_file(self, file_obj : TextIO) -> SubtitleData:
-        return SubtitleData(lines=[], metadata={})
+ASS_ACCENTED_CONTENT = """[Script Info]
+Title: Test with accents
+ScriptType: v4.00+
 
-    def parse_string(self, content : str) -> SubtitleData:
-        return SubtitleData(lines=[], metadata={})
+[V4+ Styles]
+Format: Name, Fontname, Fontsize, PrimaryColor, SecondaryColor, OutlineColor, BackColor, Bold, Italic, Underline, StrikeOut, ScaleX, ScaleY, Spacing, Angle, BorderStyle, Outline, Shadow, Alignment, MarginL, MarginR, MarginV, Encoding
+Style: Default,Arial,20,&H00FFFFFF,&H000000FF,&H00000000,&H80000000,0,0,0,0,100,100,0,0,1,2,0,2,10,10,10,1
+
+[Events]
+Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
+Dialogue: 0,0:00:01.00,0:00:02.00,Default,,0,0,0,,Café à Paris
+Dialogue: 0,0:00:03.00,0:00:04.00,Default,,0,0,0,,Hôtel très cher
+"""
+
+# Latin-1 encoded copies of the accented content, to check the fallback encoding
+SRT_ACCENTED_LATIN1 = SRT_ACCENTED_CONTENT.encode('iso-8859-1')
+ASS_ACCENTED_LATIN1 = ASS_ACCENTED_CONTENT.encode('iso-8859-1')
+
+# ASS content with rich script info, to check that metadata is preserved
+ASS_METADATA_CONTENT = """[Script Info]
+Title: Test Movie
+ScriptType: v4.00+
+WrapStyle: 0
+Collisions: Normal
+ScaledBorderAndShadow: yes
 
-    def compose(self, data : SubtitleData) -> str:
-        return ""
+[V4+ Styles]
+Format: Name, Fontname, Fontsize, PrimaryColor, SecondaryColor, OutlineColor, BackColor, Bold, Italic, Underline, StrikeOut, ScaleX, ScaleY, Spacing, Angle, BorderStyle, Outline, Shadow, Alignment, MarginL, MarginR, MarginV, Encoding
+Style: Default,Arial,20,&H00FFFFFF,&H000000FF,&H00000000,&H80000000,0,0,0,0,100,100,0,0,1,2,0,2,10,10,10,1
 
-    def load_file(self, path: str) -> SubtitleData:
-        return self.parse_string("")
+[Events]
+Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
+Dialogue: 0,0:00:01.00,0:00:02.00,Default,,0,0,0,,Test subtitle
+"""
 
 
 class TestSubtitleFormatRegistry(LoggedTestCase):
-    def setUp(self) -> None:
-        super().setUp()
+    _discovered_handlers : list[type[SubtitleFileHandler]] = []
+    _tmpdir : tempfile.TemporaryDirectory
+
+    # (name, content, suffix, expected format, expected first line)
+    DETECTION_CASES : list[tuple[str, str|bytes, str, str, str|None]] = [
+        ("srt_as_txt", SRT_CONTENT, ".txt", '.srt', 'Test subtitle'),
+        ("srt_utf8_accents", SRT_ACCENTED_CONTENT, ".txt", '.srt', 'Café à Paris'),
+        ("ass_as_txt", ASS_CONTENT, ".txt", '.ass', None),
+        ("ssa_as_ass", SSA_CONTENT, ".ass", '.ssa', None),
+        ("srt_latin1", SRT_ACCENTED_LATIN1, ".txt", '.srt', 'Café à Paris'),
+        ("ass_latin1", ASS_ACCENTED_LATIN1, ".txt", '.ass', 'Café à Paris'),
+    ]
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        # Discover the formats once and register the same handlers for each test, leaving out the test stubs
         SubtitleFormatRegistry.clear()
         SubtitleFormatRegistry.discover()
+        cls._discovered_handlers = [handler for handler in SubtitleFileHandler.__subclasses__() if handler.__module__ != __name__]
+        cls._tmpdir = tempfile.TemporaryDirectory()
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls._tmpdir.cleanup()
+        # Leave an empty registry with autodiscovery enabled for other test modules
+        SubtitleFormatRegistry.clear()
+        SubtitleFormatRegistry.enable_autodiscovery()
+        super().tearDownClass()
+
+    def setUp(self) -> None:
+        super().setUp()
+        SubtitleFormatRegistry.disable_autodiscovery()
+        for handler_class in self._discovered_handlers:
+            SubtitleFormatRegistry.register_handler(handler_class)
+
+    def _expect_raises(self, exc_type : type[Exception], label : str, fn : Callable[..., Any], *args, **kwargs) -> Exception:
+        """ Call fn and check that it raises exc_type, logging the expected error """
+        try:
+            fn(*args, **kwargs)
+        except exc_type as ex:
+            log_input_expected_error(label, exc_type, ex)
+            return ex
+        self.fail(f"{exc_type.__name__} not raised")
+
+    def _unexpected_parse(self, *args, **kwargs):
+        """ Parse function for content that should be rejected before it is parsed """
+        self.fail("Content should have been rejected without parsing")
+
+    def _write_temp(self, name : str, content : str|bytes) -> str:
+        """ Write content to a file in the shared temporary directory and return its path """
+        path = os.path.join(self._tmpdir.name, name)
+        if isinstance(content, bytes):
+            # Raw content is written with a single unbuffered write (or none, for an empty file)
+            fd = os.open(path, os.O_CREAT | os.O_WRONLY | os.O_TRUNC, 0o600)
+            try:
+                if content:
+                    os.write(fd, content)
+            finally:
+                os.close(fd)
+        else:
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write(content)
+        return path
 
     def test_AutoDiscovery(self):
+        SubtitleFormatRegistry.clear()
+        self.assertLoggedFalse('registry empty before discovery', bool(SubtitleFormatRegistry._handlers))
+
         handler = SubtitleFormatRegistry.get_handler_by_extension('.srt')
         self.assertLoggedIs(".srt handler", SrtFileHandler, handler)
+        self.assertLoggedTrue('discovered flag after lookup', SubtitleFormatRegistry._discovered)
 
     @skip_if_debugger_attached
     def test_UnknownExtension(self):
-        with self.assertRaises(ValueError) as e:
-            SubtitleFormatRegistry.get_handler_by_extension('.unknown')
-        log_input_expected_error('.unknown', ValueError, e.exception)
+        self._expect_raises(ValueError, '.unknown', SubtitleFormatRegistry.get_handler_by_extension, '.unknown')
 
     def test_EnumerateFormats(self):
         formats = SubtitleFormatRegistry.enumerate_formats()
@@ -70,27 +212,30 @@ class TestSubtitleFormatRegistry(LoggedTestCase):
 
         SubtitleFormatRegistry.clear()
 
+    def test_RegisterBeforeDiscovery(self):
+
+        SubtitleFormatRegistry.clear()
+
+        low_priority_handler = _stub_srt_handler(0)
+        SubtitleFormatRegistry.register_handler(low_priority_handler)
+        handler = SubtitleFormatRegistry.get_handler_by_extension('.srt')
+        self.assertLoggedIs('built-in handler has priority', SrtFileHandler, handler)
+
     def test_CreateHandlerWithFilename(self):
         handler = SubtitleFormatRegistry.create_handler(filename="test.srt")
         self.assertLoggedIsInstance('test.srt handler instance', handler, SrtFileHandler)
 
     @skip_if_debugger_attached
     def test_CreateHandlerWithNoExtensionOrFilename(self):
-        with self.assertRaises(ValueError) as e:
-            SubtitleFormatRegistry.create_handler()
-        log_input_expected_error("None", ValueError, e.exception)
+        self._expect_raises(ValueError, "None", SubtitleFormatRegistry.create_handler)
 
     @skip_if_debugger_attached
     def test_CreateHandlerWithEmptyExtension(self):
-        with self.assertRaises(ValueError) as e:
-            SubtitleFormatRegistry.create_handler(extension="")
-        log_input_expected_error('""', ValueError, e.exception)
+        self._expect_raises(ValueError, '""', SubtitleFormatRegistry.create_handler, extension="")
 
     @skip_if_debugger_attached
     def test_CreateHandlerWithInvalidFilename(self):
-        with self.assertRaises(ValueError) as e:
-            SubtitleFormatRegistry.create_handler(filename="test")
-        log_input_expected_error("test", ValueError, e.exception)
+        self._expect_raises(ValueError, "test", SubtitleFormatRegistry.create_handler, filename="test")
 
     def test_ListAvailableFormats(self):
         formats = SubtitleFormatRegistry.list_available_formats()
@@ -101,116 +246,101 @@ class TestSubtitleFormatRegistry(LoggedTestCase):
         SubtitleFormatRegistry.disable_autodiscovery()
         formats = SubtitleFormatRegistry.list_available_formats()
         self.assertLoggedEqual('empty registry', 'None', formats)
-        SubtitleFormatRegistry.discover()
 
     def test_GetFormatFromFilename(self):
-        
-        extension = SubtitleFormatRegistry.get_format_from_filename("test.srt")
-        self.assertLoggedEqual('test.srt extension', '.srt', extension)
 
-        extension = SubtitleFormatRegistry.get_format_from_filename("test.SRT")
-        self.assertLoggedEqual('test.SRT extension', '.srt', extension)
+        cases = [
+            ("test.srt", '.srt'),
+            ("test.SRT", '.srt'),
+            ("test", None),
+            ("path/to/file.vtt", '.vtt'),
+            ("path/to/.hidden", None),
+        ]
 
-        extension = SubtitleFormatRegistry.get_format_from_filename("test")
-        self.assertLoggedIsNone('test extension', extension)
-        
-        extension = SubtitleFormatRegistry.get_format_from_filename("path/to/file.vtt")
-        self.assertLoggedEqual('path/to/file.vtt extension', '.vtt', extension)
+        for filename, expected in cases:
+            extension = SubtitleFormatRegistry.get_format_from_filename(filename)
+            self.assertLoggedEqual(f'{filename} extension', expected, extension)
 
     def test_DetectFormatAndLoadFile(self):
         
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.srt', delete=False, encoding='utf-8') as f:
-            f.write("1\n00:00:01,000 --> 00:00:02,000\nTest subtitle\n")
-            temp_path = f.name
-        
-        try:
-            data = SubtitleFormatRegistry.detect_format_and_load_file(temp_path)
-            self.assertLoggedIn('metadata has detected_format', 'detected_format', data.metadata)
-            self.assertIsInstance(data, SubtitleData)
-        finally:
-            os.unlink(temp_path)
+        temp_path = self._write_temp("DetectFormatAndLoadFile.srt", "1\n00:00:01,000 --> 00:00:02,000\nTest subtitle\n")
+
+        data = SubtitleFormatRegistry.detect_format_and_load_file(temp_path)
+        self.assertLoggedIn('metadata has detected_format', 'detected_format', data.metadata)
+        self.assertIsInstance(data, SubtitleData)
 
-    @patch('pysubs2.load')
     @skip_if_debugger_attached
-    def test_DetectFormatAndLoadFileError(self, mock_load):
-        mock_load.side_effect = Exception("Parse error")
+    def test_DetectFormatAndLoadFileSkipsFailedFormat(self):
 
-        with self.assertRaises(SubtitleParseError) as e:
-            SubtitleFormatRegistry.detect_format_and_load_file("nonexistent.srt")
-        log_input_expected_error("nonexistent.srt", SubtitleParseError, e.exception)
+        temp_path = self._write_temp("DetectFormatAndLoadFileSkipsFailedFormat.srt", "1\n00:00:01,000 --> 00:00:02,000\nTest subtitle\n")
+
+        self._expect_raises(SubtitleParseError, temp_path, SubtitleFormatRegistry.detect_format_and_load_file, temp_path, failed_format='.srt')
+
+        original_error = SubtitleParseError("Invalid timestamp at line 2")
+        ex = self._expect_raises(SubtitleParseError, temp_path, SubtitleFormatRegistry.detect_format_and_load_file, temp_path, failed_format='.srt', failed_error=original_error)
+        self.assertLoggedIs('original error is re-raised', original_error, ex)
 
-    @patch('pysubs2.load')
     @skip_if_debugger_attached
-    def test_DetectFormatAndLoadFileUnicodeError(self, mock_load):
-        
-        mock_subs = MagicMock()
-        mock_subs.format = "srt"
-        
-        mock_load.side_effect = [UnicodeDecodeError('utf-8', b'', 0, 1, 'invalid'), mock_subs]
-        
-        with patch.object(SubtitleFormatRegistry, 'create_handler') as mock_create:
-            mock_handler = MagicMock()
-            mock_handler.load_file.return_value = SubtitleData(lines=[], metadata={})
-            mock_create.return_value = mock_handler
-            
-            data = SubtitleFormatRegistry.detect_format_and_load_file("test.srt")
-            self.assertLoggedEqual('fallback encoding used', 2, mock_load.call_count)
-            self.assertIsInstance(data, SubtitleData)
-
-    def test_ClearMethod(self):
-        
-        SubtitleFormatRegistry.discover()
-        formats_before = len(SubtitleFormatRegistry.enumerate_formats())
-        self.assertLoggedGreater('formats before clear', formats_before, 0)
+    def test_DetectFormatAndLoadFileError(self):
+        temp_path = self._write_temp("DetectFormatAndLoadFileError.srt", SRT_CONTENT)
 
-        SubtitleFormatRegistry.disable_autodiscovery()
-        formats_after = len(SubtitleFormatRegistry.enumerate_formats())
-        self.assertLoggedEqual('formats after clear', 0, formats_after)
-        
-        SubtitleFormatRegistry.discover()
+        def failing_parse(*args, **kwargs):
+            raise Exception("Parse error")
+
+        self._expect_raises(SubtitleParseError, temp_path, SubtitleFormatRegistry.detect_format_and_load_file, temp_path, _load_fn=failing_parse)
+
+    @skip_if_debugger_attached
+    def test_DetectFormatAndLoadFileUnicodeError(self):
+        temp_path = self._write_temp("DetectFormatAndLoadFileUnicodeError.txt", SRT_ACCENTED_LATIN1)
+
+        parse_file = pysubs2.SSAFile.from_file
+        calls = [0]
+        def counting_parse(*args, **kwargs):
+            calls[0] += 1
+            return parse_file(*args, **kwargs)
+
+        data = SubtitleFormatRegistry.detect_format_and_load_file(temp_path, _load_fn=counting_parse)
+
+        self.assertLoggedEqual('content parsed once', 1, calls[0])
+        self.assertLoggedEqual('fallback encoding used', 'Café à Paris', data.lines[0].text)
+
+    def test_RegistryStateMachine(self):
+
+        formats = SubtitleFormatRegistry.enumerate_formats()
+        self.assertLoggedGreater('formats after discovery', len(formats), 0)
 
-    def test_DiscoverMethod(self):
-        
         SubtitleFormatRegistry.disable_autodiscovery()
-        formats_before = len(SubtitleFormatRegistry.enumerate_formats())
-        self.assertLoggedEqual('formats before discover', 0, formats_before)
+        self.assertLoggedEqual('formats after disable', 0, len(SubtitleFormatRegistry.enumerate_formats()))
+        self.assertLoggedTrue('discovered flag after disable', SubtitleFormatRegistry._discovered)
+
+        SubtitleFormatRegistry.enable_autodiscovery()
+        self.assertLoggedFalse('discovered flag after enable', SubtitleFormatRegistry._discovered)
+        self.assertLoggedEqual('formats rediscovered on access', formats, SubtitleFormatRegistry.enumerate_formats())
+        self.assertLoggedTrue('discovered flag after access', SubtitleFormatRegistry._discovered)
+
+        SubtitleFormatRegistry.clear()
+        self.assertLoggedFalse('discovered flag after clear', SubtitleFormatRegistry._discovered)
 
         SubtitleFormatRegistry.discover()
-        formats_after = len(SubtitleFormatRegistry.enumerate_formats())
-        self.assertLoggedGreater('formats after discover', formats_after, 0)
+        self.assertLoggedEqual('formats after explicit discover', formats, SubtitleFormatRegistry.enumerate_formats())
 
     def test_EnsureDiscoveredBehavior(self):
         
         SubtitleFormatRegistry.disable_autodiscovery()
-        formats_before = len(SubtitleFormatRegistry._handlers)
-        self.assertLoggedEqual('handlers before access', 0, formats_before)
+        formats_before = SubtitleFormatRegistry.enumerate_formats()
+        self.assertLoggedEqual('formats before access', [], formats_before)
 
         SubtitleFormatRegistry.enable_autodiscovery()
-        formats = SubtitleFormatRegistry.enumerate_formats()
-        formats_after = len(SubtitleFormatRegistry._handlers)
-        self.assertLoggedGreater('handlers after access', formats_after, 0)
-
-        self.assertLoggedGreater('formats list non-empty', len(formats), 0)
+        handler = SubtitleFormatRegistry.get_handler_by_extension('.srt')
+        self.assertLoggedIs('handler lookup triggers discovery', SrtFileHandler, handler)
 
-        self.assertLoggedTrue('discovered flag', SubtitleFormatRegistry._discovered)
+        formats_after = SubtitleFormatRegistry.enumerate_formats()
+        self.assertLoggedGreater('formats list non-empty', len(formats_after), 0)
 
     def test_RegisterHandlerWithLowerPriority(self):
         
-        class LowerPrioritySrtHandler(SubtitleFileHandler):
-            SUPPORTED_EXTENSIONS = {'.srt': 1}
-            
-            def parse_file(self, file_obj : TextIO) -> SubtitleData:
-                return SubtitleData(lines=[], metadata={})
-            
-            def parse_string(self, content : str) -> SubtitleData:
-                return SubtitleData(lines=[], metadata={})
-            
-            def compose(self, data : SubtitleData) -> str:
-                return ""
-            
-            def load_file(self, path: str) -> SubtitleData:
-                return self.parse_string("")
-        
+        LowerPrioritySrtHandler = _stub_srt_handler(1)
+
         SubtitleFormatRegistry.disable_autodiscovery()
         SubtitleFormatRegistry.register_handler(SrtFileHandler)
         handler_before = SubtitleFormatRegistry.get_handler_by_extension('.srt')
@@ -224,290 +354,88 @@ class TestSubtitleFormatRegistry(LoggedTestCase):
 
     def test_CaseInsensitiveExtensions(self):
         
-        handler_lower = SubtitleFormatRegistry.get_handler_by_extension('.srt')
-        handler_upper = SubtitleFormatRegistry.get_handler_by_extension('.SRT')
-        handler_mixed = SubtitleFormatRegistry.get_handler_by_extension('.Srt')
-
-        self.assertLoggedIs('lower vs upper handler', handler_lower, handler_upper)
-        self.assertLoggedIs('upper vs mixed handler', handler_upper, handler_mixed)
-
-    def test_DisableAutodiscovery(self):
-        
-        SubtitleFormatRegistry.discover()
-        formats_before = len(SubtitleFormatRegistry.enumerate_formats())
-        self.assertLoggedGreater('formats before disable', formats_before, 0)
+        extensions = ['.srt', '.SRT', '.Srt']
+        handlers = {SubtitleFormatRegistry.get_handler_by_extension(ext) for ext in extensions}
 
-        SubtitleFormatRegistry.disable_autodiscovery()
-        formats_after = len(SubtitleFormatRegistry.enumerate_formats())
-        discovered_flag = SubtitleFormatRegistry._discovered
-
-        self.assertLoggedEqual('formats after disable', 0, formats_after)
-        self.assertLoggedTrue('discovered flag after disable', discovered_flag)
-        
-        SubtitleFormatRegistry.discover()
-
-    def test_EnableAutodiscovery(self):
-        
-        SubtitleFormatRegistry.disable_autodiscovery()
-        discovered_flag_before = SubtitleFormatRegistry._discovered
-        self.assertLoggedTrue('discovered flag before enable', discovered_flag_before)
-
-        SubtitleFormatRegistry.enable_autodiscovery()
-        discovered_flag_after = SubtitleFormatRegistry._discovered
-        self.assertLoggedFalse('discovered flag after enable', discovered_flag_after)
-        
-        SubtitleFormatRegistry.discover()
+        self.assertLoggedEqual('one handler for all casings', 1, len(handlers), input_value=extensions)
+        self.assertLoggedIs('handler for all casings', SrtFileHandler, next(iter(handlers)))
 
     def test_DoubleDiscoveryBehavior(self):
         
         SubtitleFormatRegistry.clear()
         SubtitleFormatRegistry.discover()
-        handlers_after_first = SubtitleFormatRegistry._handlers.copy()
-        priorities_after_first = SubtitleFormatRegistry._priorities.copy()
+        before = (tuple(sorted(SubtitleFormatRegistry._handlers.items())), tuple(sorted(SubtitleFormatRegistry._priorities.items())))
+        srt_handler = SubtitleFormatRegistry._handlers['.srt']
 
         SubtitleFormatRegistry.discover()
-        handlers_after_second = SubtitleFormatRegistry._handlers.copy()
-        priorities_after_second = SubtitleFormatRegistry._priorities.copy()
+        after = (tuple(sorted(SubtitleFormatRegistry._handlers.items())), tuple(sorted(SubtitleFormatRegistry._priorities.items())))
 
-        self.assertLoggedEqual(
-            'handlers unchanged after double discovery',
-            handlers_after_first,
-            handlers_after_second,
-        )
-        
-        self.assertLoggedEqual(
-            'priorities unchanged after double discovery',
-            priorities_after_first,
-            priorities_after_second,
-        )
+        self.assertLoggedEqual('handlers and priorities unchanged after double discovery', before, after)
+        self.assertLoggedIs('.srt handler not re-registered', srt_handler, SubtitleFormatRegistry._handlers['.srt'])
 
-    # Phase 6: Enhanced Format Detection Tests
-    def test_DetectSrtFormatWithTxtExtension(self):
-        
-        srt_content = "1\n00:00:01,000 --> 00:00:02,000\nTest subtitle\n\n2\n00:00:03,000 --> 00:00:04,000\nAnother line\n"
-        
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.txt', delete=False, encoding='utf-8') as f:
-            f.write(srt_content)
-            temp_path = f.name
-        
-        try:
-            data = SubtitleFormatRegistry.detect_format_and_load_file(temp_path)
-            detected_format = data.metadata.get('detected_format')
-            self.assertLoggedEqual('detected .srt format', '.srt', detected_format)
-            lines_count = len(data.lines)
-            self.assertLoggedGreater('srt lines count', lines_count, 0)
-        finally:
-            os.unlink(temp_path)
-
-    def test_DetectAssFormatWithTxtExtension(self):
-        
-        ass_content = """[Script Info]
-Title: Test
-ScriptType: v4.00+
+    def test_DetectFormatFromContent(self):
 
-[V4+ Styles]
-Format: Name, Fontname, Fontsize, PrimaryColor, SecondaryColor, OutlineColor, BackColor, Bold, Italic, Underline, StrikeOut, ScaleX, ScaleY, Spacing, Angle, BorderStyle, Outline, Shadow, Alignment, MarginL, MarginR, MarginV, Encoding
-Style: Default,Arial,20,&H00FFFFFF,&H000000FF,&H00000000,&H80000000,0,0,0,0,100,100,0,0,1,2,0,2,10,10,10,1
+        for name, content, suffix, expected_format, expected_first_line in self.DETECTION_CASES:
+            with self.subTest(name=name):
+                temp_path = self._write_temp(name + suffix, content)
 
-[Events]
-Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
-Dialogue: 0,0:00:01.00,0:00:02.00,Default,,0,0,0,,Test subtitle
-Dialogue: 0,0:00:03.00,0:00:04.00,Default,,0,0,0,,Another line
-"""
-        
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.txt', delete=False, encoding='utf-8') as f:
-            f.write(ass_content)
-            temp_path = f.name
-        
-        try:
-            data = SubtitleFormatRegistry.detect_format_and_load_file(temp_path)
-            detected_format = data.metadata.get('detected_format')
-            self.assertLoggedEqual('detected .ass format', '.ass', detected_format)
-            lines_count = len(data.lines)
-            self.assertLoggedGreater('ass lines count', lines_count, 0)
-        finally:
-            os.unlink(temp_path)
-
-    def test_DetectSsaFormatWithAssExtension(self):
-        
-        ssa_content = """[Script Info]
-Title: Test SSA
-ScriptType: v4.00
+                data = SubtitleFormatRegistry.detect_format_and_load_file(temp_path)
+                detected_format = data.metadata.get('detected_format')
+                self.assertLoggedEqual(f'{name} detected format', expected_format, detected_format)
+                self.assertLoggedGreater(f'{name} lines count', len(data.lines), 0)
 
-[V4 Styles]
-Format: Name, Fontname, Fontsize, PrimaryColor, SecondaryColor, TertiaryColor, BackColor, Bold, Italic, BorderStyle, Outline, Shadow, Alignment, MarginL, MarginR, MarginV, AlphaLevel, Encoding
-Style: Default,Arial,20,65535,255,0,0,0,0,1,2,0,2,10,10,10,0,1
-
-[Events]
-Format: Marked, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
-Dialogue: Marked=0,0:00:01.00,0:00:02.00,Default,,0,0,0,,Test subtitle
-Dialogue: Marked=0,0:00:03.00,0:00:04.00,Default,,0,0,0,,Another line
-"""
-        
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.ass', delete=False, encoding='utf-8') as f:
-            f.write(ssa_content)
-            temp_path = f.name
-        
-        try:
-            data = SubtitleFormatRegistry.detect_format_and_load_file(temp_path)
-            # SSA files are correctly detected as .ssa by pysubs2
-            detected_format = data.metadata.get('detected_format')
-            self.assertLoggedEqual('detected .ssa format', '.ssa', detected_format)
-            lines_count = len(data.lines)
-            self.assertLoggedGreater('ssa lines count', lines_count, 0)
-        finally:
-            os.unlink(temp_path)
+                if expected_first_line is not None:
+                    self.assertLoggedEqual(f'{name} first line text', expected_first_line, data.lines[0].text)
 
     @skip_if_debugger_attached
     def test_FormatDetectionWithMalformedFile(self):
         
         malformed_content = "This is not a valid subtitle file\nJust random text\nWith no format\n"
         
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.txt', delete=False, encoding='utf-8') as f:
-            f.write(malformed_content)
-            temp_path = f.name
-        
-        try:
-            with self.assertRaises(SubtitleParseError) as e:
-                SubtitleFormatRegistry.detect_format_and_load_file(temp_path)
-            log_input_expected_error("malformed file content", SubtitleParseError, e.exception)
-            # Verify the error message is user-friendly
-            error_msg = str(e.exception)
-            self.assertLoggedTrue(
-                'error message references format',
-                'format' in error_msg.lower(),
-                input_value=error_msg,
-            )
-        finally:
-            os.unlink(temp_path)
+        temp_path = self._write_temp("FormatDetectionWithMalformedFile.txt", malformed_content)
+
+        error = self._expect_raises(SubtitleParseError, "malformed file content", SubtitleFormatRegistry.detect_format_and_load_file, temp_path)
+        # Verify the error message is user-friendly
+        error_msg = str(error)
+        self.assertLoggedTrue(
+            'error message references format',
+            'format' in error_msg.lower(),
+            input_value=error_msg,
+        )
 
     @skip_if_debugger_attached
     def test_FormatDetectionWithEmptyFile(self):
         
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.txt', delete=False, encoding='utf-8') as f:
-            f.write("")  # Empty file
-            temp_path = f.name
-        
-        try:
-            with self.assertRaises(SubtitleParseError) as e:
-                SubtitleFormatRegistry.detect_format_and_load_file(temp_path)
-            log_input_expected_error("empty file content", SubtitleParseError, e.exception)
-        finally:
-            os.unlink(temp_path)
+        temp_path = self._write_temp("FormatDetectionWithEmptyFile.txt", b"")
+
+        self._expect_raises(SubtitleParseError, "empty file content", SubtitleFormatRegistry.detect_format_and_load_file, temp_path, _load_fn=self._unexpected_parse)
 
     @skip_if_debugger_attached
     def test_FormatDetectionWithBinaryFile(self):
         
         # Create a binary file that's definitely not a subtitle
-        with tempfile.NamedTemporaryFile(mode='wb', suffix='.txt', delete=False) as f:
-            f.write(b'\x00\x01\x02\x03\x04\x05\xFF\xFE')  # Binary data
-            temp_path = f.name
-        
-        try:
-            with self.assertRaises(SubtitleParseError) as e:
-                SubtitleFormatRegistry.detect_format_and_load_file(temp_path)
-            log_input_expected_error("binary file content", SubtitleParseError, e.exception)
-        finally:
-            os.unlink(temp_path)
+        temp_path = self._write_temp("FormatDetectionWithBinaryFile.txt", b'\x00\x01\x02\x03\x04\x05\xFF\xFE')
+
+        self._expect_raises(SubtitleParseError, "binary file content", SubtitleFormatRegistry.detect_format_and_load_file, temp_path, _load_fn=self._unexpected_parse)
 
     def test_FormatDetectionPreservesOriginalMetadata(self):
-        
-        # Use ASS format since it has rich metadata
-        ass_content = """[Script Info]
-Title: Test Movie
-ScriptType: v4.00+
-WrapStyle: 0
-Collisions: Normal
-ScaledBorderAndShadow: yes
 
-[V4+ Styles]
-Format: Name, Fontname, Fontsize, PrimaryColor, SecondaryColor, OutlineColor, BackColor, Bold, Italic, Underline, StrikeOut, ScaleX, ScaleY, Spacing, Angle, BorderStyle, Outline, Shadow, Alignment, MarginL, MarginR, MarginV, Encoding
-Style: Default,Arial,20,&H00FFFFFF,&H000000FF,&H00000000,&H80000000,0,0,0,0,100,100,0,0,1,2,0,2,10,10,10,1
+        temp_path = self._write_temp("FormatDetectionPreservesOriginalMetadata.unknown", ASS_METADATA_CONTENT)
 
-[Events]
-Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
-Dialogue: 0,0:00:01.00,0:00:02.00,Default,,0,0,0,,Test subtitle
-"""
-        
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.unknown', delete=False, encoding='utf-8') as f:
-            f.write(ass_content)
-            temp_path = f.name
-        
-        try:
-            data = SubtitleFormatRegistry.detect_format_and_load_file(temp_path)
-            detected_format = data.metadata.get('detected_format')
-            self.assertLoggedEqual('detected .ass format', '.ass', detected_format)
-            # Check that original metadata from SSA file is preserved
-            self.assertLoggedIn("metadata includes 'info'", 'info', data.metadata)
-            script_info = data.metadata['info']
-            title = script_info.get('Title')
-            self.assertLoggedEqual("script_info['Title']", 'Test Movie', title)
-        finally:
-            os.unlink(temp_path)
+        data = SubtitleFormatRegistry.detect_format_and_load_file(temp_path)
+        detected_format = data.metadata.get('detected_format')
+        self.assertLoggedEqual('detected .ass format', '.ass', detected_format)
+        # Check that original metadata from SSA file is preserved
+        self.assertLoggedIn("metadata includes 'info'", 'info', data.metadata)
+        script_info = data.metadata['info']
+        title = script_info.get('Title')
+        self.assertLoggedEqual("script_info['Title']", 'Test Movie', title)
 
     @skip_if_debugger_attached
     def test_FormatDetectionNonexistentFile(self):
         
         filename = "nonexistent_file.txt"
-        with self.assertRaises(SubtitleParseError) as e:
-            SubtitleFormatRegistry.detect_format_and_load_file(filename)
-        log_input_expected_error(f"filename={filename}", SubtitleParseError, e.exception)
-
-    @skip_if_debugger_attached
-    def test_FormatDetectionWithNonUtf8SrtFile(self):
-        
-        # SRT content with non-ASCII characters (French accents)
-        srt_content = "1\n00:00:01,000 --> 00:00:02,000\nCafé à Paris\n\n2\n00:00:03,000 --> 00:00:04,000\nHôtel très cher\n"
-        
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.txt', delete=False, encoding='iso-8859-1') as f:
-            f.write(srt_content)
-            temp_path = f.name
-        
-        try:
-            data = SubtitleFormatRegistry.detect_format_and_load_file(temp_path)
-            detected_format = data.metadata.get('detected_format')
-            self.assertLoggedEqual('detected .srt format', '.srt', detected_format)
-            lines_count = len(data.lines)
-            self.assertLoggedGreater('srt lines count (non-utf)', lines_count, 0)
-            # Verify content was loaded correctly
-            first_line_text = data.lines[0].text if data.lines else ""
-            self.assertLoggedEqual('first line text', 'Café à Paris', first_line_text)
-        finally:
-            os.unlink(temp_path)
-
-    @skip_if_debugger_attached
-    def test_FormatDetectionWithNonUtf8AssFile(self):
-        
-        # ASS content with non-ASCII characters
-        ass_content = """[Script Info]
-Title: Test with accents
-ScriptType: v4.00+
-
-[V4+ Styles]
-Format: Name, Fontname, Fontsize, PrimaryColor, SecondaryColor, OutlineColor, BackColor, Bold, Italic, Underline, StrikeOut, ScaleX, ScaleY, Spacing, Angle, BorderStyle, Outline, Shadow, Alignment, MarginL, MarginR, MarginV, Encoding
-Style: Default,Arial,20,&H00FFFFFF,&H000000FF,&H00000000,&H80000000,0,0,0,0,100,100,0,0,1,2,0,2,10,10,10,1
-
-[Events]
-Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
-Dialogue: 0,0:00:01.00,0:00:02.00,Default,,0,0,0,,Café à Paris
-Dialogue: 0,0:00:03.00,0:00:04.00,Default,,0,0,0,,Hôtel très cher
-"""
-        
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.txt', delete=False, encoding='iso-8859-1') as f:
-            f.write(ass_content)
-            temp_path = f.name
-        
-        try:
-            data = SubtitleFormatRegistry.detect_format_and_load_file(temp_path)
-            detected_format = data.metadata.get('detected_format')
-            self.assertLoggedEqual('detected .ass format (non-utf)', '.ass', detected_format)
-            lines_count = len(data.lines)
-            self.assertLoggedGreater('ass lines count (non-utf)', lines_count, 0)
-            # Verify content was loaded correctly
-            first_line_text = data.lines[0].text if data.lines else ""
-            self.assertLoggedEqual('first line text (ass)', 'Café à Paris', first_line_text)
-        finally:
-            os.unlink(temp_path)
+        self._expect_raises(SubtitleParseError, f"filename={filename}", SubtitleFormatRegistry.detect_format_and_load_file, filename)
 
 
 
@@ -1,8 +1,11 @@
+import json
 import os
 import tempfile
 import unittest
 from typing import cast
+from unittest.mock import patch
 
+from PySubtrans.Formats.SrtFileHandler import SrtFileHandler
 from PySubtrans.Helpers.TestCases import SubtitleTestCase
 from PySubtrans.Helpers.Tests import skip_if_debugger_attached
 from PySubtrans.SettingsType import SettingsType
@@ -27,7 +30,8 @@ class SubtitleProjectTests(SubtitleTestCase):
         """Set up test fixtures"""
         super().setUp()
 
-        self.temp_dir = tempfile.mkdtemp()
+        self._temp_dir = tempfile.TemporaryDirectory()
+        self.temp_dir = self._temp_dir.name
         self.test_srt_file = os.path.join(self.temp_dir, "test.srt")
         self.test_project_file = os.path.join(self.temp_dir, "test.subtrans")
 
@@ -37,15 +41,9 @@ class SubtitleProjectTests(SubtitleTestCase):
             f.write(original_content)
 
     def tearDown(self):
-        """Clean up test fixtures"""
-        try:
-            if os.path.exists(self.test_srt_file):
-                os.remove(self.test_srt_file)
-            if os.path.exists(self.test_project_file):
-                os.remove(self.test_project_file)
-            os.rmdir(self.temp_dir)
-        except Exception:
-            pass
+        """Clean up test fixtures, including any files written by the test"""
+        self._temp_dir.cleanup()
+        super().tearDown()
 
     def test_default_initialization(self):
         """Test SubtitleProject initializes with default settings"""
@@ -133,6 +131,20 @@ class SubtitleProjectTests(SubtitleTestCase):
             "Non-project settings should be filtered out by UpdateProjectSettings",
         )
 
+    def test_update_project_settings_copies_lists(self):
+        """Test UpdateProjectSettings does not share the caller's names list"""
+
+        project = SubtitleProject()
+
+        names = ['Character1', 'Character2']
+        project.UpdateProjectSettings(SettingsType({'names': names}))
+
+        names.append('Character3')
+        self.assertLoggedSequenceEqual("project names unchanged by caller", ['Character1', 'Character2'], project.subtitles.settings.get_str_list('names'))
+
+        project.UpdateProjectSettings(SettingsType({'names': names}))
+        self.assertLoggedSequenceEqual("later update detected", ['Character1', 'Character2', 'Character3'], project.subtitles.settings.get_str_list('names'))
+
     def test_update_project_settings_legacy(self):
         """Test UpdateProjectSettings with legacy settings compatibility"""
 
@@ -374,6 +386,92 @@ class SubtitleProjectTests(SubtitleTestCase):
         self.assertLoggedEqual("preserved scene count", original_scene_count, new_scene_count)
 
 
+    def test_project_file_omits_empty_settings(self):
+        """Test that unset settings are not written to the project file and are not treated as changes on reload"""
+        project = SubtitleProject(persistent=True)
+        project.InitialiseProject(self.test_srt_file)
+        project.UpdateProjectSettings(SettingsType({'target_language': 'French'}))
+
+        batcher = SubtitleBatcher(self.options)
+        with project.GetEditor() as editor:
+            editor.AutoBatch(batcher)
+
+        project.SaveProjectFile(self.test_project_file)
+
+        with open(self.test_project_file, 'r', encoding='utf-8') as f:
+            project_json = json.load(f)
+
+        saved_settings = project_json.get('settings', {})
+        self.assertLoggedEqual("saved target_language", 'French', saved_settings.get('target_language'))
+        self.assertLoggedNotIn("unset movie_name not saved", 'movie_name', saved_settings)
+
+        new_project = SubtitleProject(persistent=True)
+        new_project.ReadProjectFile(self.test_project_file)
+        new_project.UpdateProjectSettings(SettingsType({'target_language': 'French', 'movie_name': None}))
+
+        self.assertLoggedFalse("needs_writing after applying unchanged settings", new_project.needs_writing)
+
+    def test_save_project_writes_project_and_translation(self):
+        """Test SaveProject writes both the project file and the translation when both are needed"""
+        project = SubtitleProject(persistent=True)
+        project.InitialiseProject(self.test_srt_file)
+
+        batcher = SubtitleBatcher(self.options)
+        with project.GetEditor() as editor:
+            editor.AutoBatch(batcher)
+            editor.DuplicateOriginalsAsTranslations()
+
+        project.SaveProject()
+
+        self.assertLoggedFalse("needs_writing after save", project.needs_writing)
+
+        project_path = project.projectfile
+        self.assertLoggedIsNotNone("project file path set", project_path)
+        if project_path:
+            self.assertLoggedTrue("project file exists", os.path.exists(project_path))
+
+        translation_path = project.subtitles.outputpath
+        self.assertLoggedIsNotNone("translation path set", translation_path)
+        if translation_path:
+            self.assertLoggedTrue("translation file exists", os.path.exists(translation_path))
+            os.remove(translation_path)
+
+        new_project = SubtitleProject()
+        new_project.ReadProjectFile(project_path)
+        self.assertLoggedEqual("reloaded scene count", project.subtitles.scenecount, new_project.subtitles.scenecount)
+        self.assertLoggedTrue("reloaded project is translated", new_project.all_translated)
+
+    def test_save_translation_include_original(self):
+        """Test SaveTranslation merges original and translated text for complete and partial translations"""
+        project = SubtitleProject()
+        project.InitialiseProject(self.test_srt_file)
+        project.UpdateProjectSettings(SettingsType({'include_original': True}))
+
+        batcher = SubtitleBatcher(self.options)
+        with project.GetEditor() as editor:
+            editor.AutoBatch(batcher)
+            editor.DuplicateOriginalsAsTranslations()
+
+        subtitles = project.subtitles
+        originals = subtitles.originals or []
+        outputpath = os.path.join(self.temp_dir, "merged.srt")
+
+        subtitles.SaveTranslation(outputpath)
+        merged = subtitles.translated or []
+        self.assertLoggedEqual("merged line count", len(originals), len(merged))
+        self.assertLoggedEqual("merged text", f"{originals[0].text}\n{originals[0].text}", merged[0].text)
+
+        # Remove the translation for the last batch to exercise the partial merge
+        last_batch = subtitles.scenes[-1].batches[-1]
+        untranslated_number = last_batch.originals[-1].number
+        last_batch.translated = []
+
+        subtitles.SaveTranslation(outputpath)
+        merged = subtitles.translated or []
+        merged_last = next(line for line in merged if line.number == untranslated_number)
+        self.assertLoggedEqual("partial merged line count", len(originals), len(merged))
+        self.assertLoggedEqual("untranslated line keeps original text", originals[-1].text, merged_last.text)
+
     def test_initialise_project_existing_subtrans(self):
         """Test InitialiseProject with existing subtrans file"""
 
@@ -596,6 +694,32 @@ Modified subtitle line 2
 
         self.assertLoggedTrue("needs_writing after edit", project.needs_writing)
 
+    @skip_if_debugger_attached
+    def test_save_translation_failure_preserves_existing_file(self):
+        """A failed SaveTranslation should leave the previous translation file intact"""
+        project = SubtitleProject()
+        project.InitialiseProject(self.test_srt_file)
+
+        batcher = SubtitleBatcher(self.options)
+        with project.GetEditor() as editor:
+            editor.AutoBatch(batcher)
+            editor.DuplicateOriginalsAsTranslations()
+
+        outputpath = os.path.join(self.temp_dir, "existing.srt")
+        project.subtitles.SaveTranslation(outputpath)
+
+        with open(outputpath, 'r', encoding='utf-8') as f:
+            existing_content = f.read()
+
+        with patch.object(SrtFileHandler, 'write_to', side_effect=ValueError("compose failed")):
+            with self.assertRaises(ValueError):
+                project.subtitles.SaveTranslation(outputpath)
+
+        with open(outputpath, 'r', encoding='utf-8') as f:
+            self.assertLoggedEqual("existing translation preserved", existing_content, f.read())
+
+        self.assertLoggedFalse("temporary file removed", os.path.exists(f"{outputpath}.tmp"))
+
     @skip_if_debugger_attached
     def test_get_editor_exception_does_not_mark_project_dirty(self):
         """GetEditor should not mark the project dirty if the edit fails"""
@@ -8,6 +8,7 @@ from PySubtrans.Helpers.TestCases import LoggedTestCase
 from PySubtrans.Helpers.Tests import log_info
 from PySubtrans.Helpers.SubtitleHelpers import MergeSubtitles, MergeTranslations, FindSplitPoint, GetProportionalDuration
 from PySubtrans.SubtitleProcessor import SubtitleProcessor
+from PySubtrans.Subtitles import Subtitles
 
 
 class TestSubtitles(LoggedTestCase):
@@ -141,6 +142,28 @@ class TestSubtitles(LoggedTestCase):
                     input_value=(line.text, characters, min_duration.total_seconds()),
                 )
 
+    def test_MergeOriginalAndTranslatedOrder(self):
+        originals = [
+            SubtitleLine.Construct(2, timedelta(seconds=3), timedelta(seconds=4), "Second"),
+            SubtitleLine.Construct(1, timedelta(seconds=1), timedelta(seconds=2), "First"),
+        ]
+        translated = [
+            SubtitleLine.Construct(2, timedelta(seconds=3), timedelta(seconds=4), "Deuxième"),
+            SubtitleLine.Construct(1, timedelta(seconds=1), timedelta(seconds=2), "Premier"),
+        ]
+
+        cases = [
+            ("complete translation", translated, ["First\nPremier", "Second\nDeuxième"]),
+            ("partial translation", translated[:1], ["First", "Second\nDeuxième"]),
+        ]
+
+        subtitles = Subtitles()
+        for description, translated_lines, expected in cases:
+            with self.subTest(description=description):
+                merged = subtitles._merge_original_and_translated(originals, translated_lines)
+                self.assertLoggedSequenceEqual(f"{description} merged in line number order", expected, [line.text for line in merged])
+                self.assertLoggedEqual(f"{description} originals unchanged", "Second", originals[0].text)
+
 class SubtitleProcessorTests(LoggedTestCase):
     example_line_1 = "1\n00:00:01,000 --> 00:00:02,000\nThis is line 1"
     example_line_2 = "2\n00:00:02,500 --> 00:00:03,500\nThis is line 2"
@@ -1,3 +1,5 @@
+import gc
+
 from PySubtrans.Helpers.TestCases import DummyProvider, LoggedTestCase
 from PySubtrans.Helpers.Tests import log_input_expected_error, skip_if_debugger_attached
 from PySubtrans.Options import Options
@@ -5,6 +7,17 @@ from PySubtrans.SettingsType import SettingsType
 from PySubtrans.TranslationProvider import TranslationProvider
 
 
+class CountingProvider(DummyProvider):
+    """ DummyProvider that counts model list requests, using data as provider settings """
+    def __init__(self, data : dict):
+        super().__init__(data)
+        self.settings.update(data)
+        self.model_requests = 0
+
+    def GetAvailableModels(self) -> list[str]:
+        self.model_requests += 1
+        return ["dummy-a", "dummy-b"]
+
 class TranslationProviderTests(LoggedTestCase):
 
     def test_create_provider_case_insensitive(self):
@@ -34,3 +47,76 @@ class TranslationProviderTests(LoggedTestCase):
         self.assertLoggedIsInstance("get_provider returns DummyProvider", provider, DummyProvider)
         self.assertLoggedEqual("options.provider normalized to canonical name", "Dummy Provider", options.provider)
         self.assertLoggedEqual("provider received settings from options", "test-model-xyz", provider.settings.get_str('model'))
+
+    def test_get_providers_cache_reset(self):
+        """get_providers reuses its cached dictionary until the cache is reset"""
+        providers = TranslationProvider.get_providers()
+        self.assertLoggedEqual("repeat call returns the same providers", dict(providers), dict(TranslationProvider.get_providers()))
+
+        TranslationProvider.ResetProvidersCache()
+        rebuilt = TranslationProvider.get_providers()
+        self.assertLoggedEqual("rebuilt dictionary has the same providers", sorted(providers), sorted(rebuilt))
+
+    @skip_if_debugger_attached
+    def test_get_providers_read_only(self):
+        """get_providers returns a mapping that callers cannot modify"""
+        providers = TranslationProvider.get_providers()
+        with self.assertRaises(TypeError) as context:
+            providers['Fake Provider'] = DummyProvider # type: ignore[index]
+        log_input_expected_error("Fake Provider", TypeError, context.exception)
+
+        self.assertLoggedNotIn("mapping is unchanged", 'Fake Provider', TranslationProvider.get_providers())
+
+    def test_get_providers_sees_new_provider(self):
+        """Defining a provider after the cache is built makes it available, even if it replaces one with the same name"""
+        TranslationProvider.get_providers()
+
+        class ReplacementProvider(TranslationProvider):
+            name = "Dummy Provider"
+
+        try:
+            self.assertLoggedIs("redefined provider replaces the cached one", ReplacementProvider, TranslationProvider.get_providers()['Dummy Provider'])
+        finally:
+            # Discard the replacement so that other tests see the original provider
+            del ReplacementProvider
+            TranslationProvider.ResetProvidersCache()
+            gc.collect()
+
+        self.assertLoggedIs("original provider restored", DummyProvider, TranslationProvider.get_providers()['Dummy Provider'])
+
+    def test_available_models_shared_between_instances(self):
+        """available_models reuses a model list fetched by another instance with the same settings"""
+        first = CountingProvider({'case': 'shared models'})
+        first.ResetAvailableModels()
+        self.assertLoggedEqual("first instance fetches models", ["dummy-a", "dummy-b"], first.available_models)
+
+        second = CountingProvider({'case': 'shared models'})
+        self.assertLoggedEqual("second instance gets cached models", ["dummy-a", "dummy-b"], second.available_models)
+        self.assertLoggedEqual("second instance did not fetch models", 0, second.model_requests)
+
+        second.ResetAvailableModels()
+        self.assertLoggedEqual("reset forces a fetch", ["dummy-a", "dummy-b"], second.available_models)
+        self.assertLoggedEqual("second instance fetched models after reset", 1, second.model_requests)
+
+    def test_available_models_cache_keyed_by_server_and_credentials(self):
+        """available_models fetches again when the server or API key changes, without storing the key"""
+        first = CountingProvider({'api_key': 'secret-key-one', 'api_base': 'https://one.example'})
+        first.ResetAvailableModels()
+        self.assertLoggedEqual("first instance fetches models", ["dummy-a", "dummy-b"], first.available_models)
+
+        cache_key = first._models_cache_key()
+        self.assertLoggedNotIn("API key is not stored in the cache key", 'secret-key-one', cache_key)
+
+        unrelated = CountingProvider({'api_key': 'secret-key-one', 'api_base': 'https://one.example', 'temperature': 0.5})
+        self.assertLoggedEqual("unrelated settings share the cached models", ["dummy-a", "dummy-b"], unrelated.available_models)
+        self.assertLoggedEqual("unrelated settings did not fetch models", 0, unrelated.model_requests)
+
+        cases = [
+            ("different API key", {'api_key': 'secret-key-two', 'api_base': 'https://one.example'}),
+            ("different server", {'api_key': 'secret-key-two', 'api_base': 'https://two.example'}),
+        ]
+
+        for description, settings in cases:
+            provider = CountingProvider(settings)
+            self.assertLoggedEqual(description, ["dummy-a", "dummy-b"], provider.available_models)
+            self.assertLoggedEqual(f"{description} fetched models", 1, provider.model_requests)
@@ -7,7 +7,7 @@ from PySubtrans.Helpers.Parse import ParseNames
 from PySubtrans.Helpers.TestCases import LoggedTestCase
 from PySubtrans.Translation import Translation
 from PySubtrans.Helpers.SubtitleHelpers import FindBestSplitIndex
-from PySubtrans.Helpers.TestCases import DummyProvider, PrepareSubtitles, SubtitleTestCase
+from PySubtrans.Helpers.TestCases import DummyProvider, DummyTranslationClient, PrepareSubtitles, SubtitleTestCase
 from PySubtrans.Helpers.Tests import log_info, log_test_name
 from PySubtrans.SettingsType import SettingsType
 from PySubtrans.SubtitleBatch import SubtitleBatch
@@ -19,6 +19,8 @@ from PySubtrans.Subtitles import Subtitles
 from PySubtrans.SubtitleScene import SubtitleScene
 from PySubtrans.SubtitleTranslator import SubtitleTranslator
 from PySubtrans.TranslationEvents import TranslationEvents
+from PySubtrans.TranslationPrompt import TranslationPrompt
+from PySubtrans.TranslationRequest import TranslationRequest
 from PySubtrans.TranslationParser import TranslationParser
 
 from ..TestData.chinese_dinner import chinese_dinner_data
@@ -207,6 +209,174 @@ class TranslationEventsTests(SubtitleTestCase):
         self.assertLoggedEqual("Warning message", "Test warning", received_messages[1][1])
         self.assertLoggedEqual("Info message", "Test info", received_messages[2][1])
 
+    def test_custom_logger_disconnection(self):
+        """Test that a custom logger is connected once and can be disconnected"""
+        events = TranslationEvents()
+        received_messages = []
+
+        class TestLogger:
+            def error(self, msg : str, *args, **kwargs):
+                received_messages.append(('ERROR', msg))
+
+            def warning(self, msg : str, *args, **kwargs):
+                received_messages.append(('WARNING', msg))
+
+            def info(self, msg : str, *args, **kwargs):
+                received_messages.append(('INFO', msg))
+
+        logger = TestLogger()
+
+        events.connect_logger(logger) #type: ignore
+        events.connect_logger(logger) #type: ignore
+        events.info.send(self, message="Connected")
+        self.assertLoggedEqual("Messages while connected", [('INFO', "Connected")], received_messages)
+
+        events.disconnect_logger(logger) #type: ignore
+        events.info.send(self, message="Disconnected")
+        events.error.send(self, message="Disconnected")
+        self.assertLoggedEqual("Messages after disconnecting", [('INFO', "Connected")], received_messages)
+
+    def test_message_signals_hold_weak_references(self):
+        """Test that message signals hold weak references to their receivers"""
+        events = TranslationEvents()
+        received_messages = []
+
+        class Receiver:
+            def on_info(self, sender, message : str):
+                received_messages.append(message)
+
+        receiver = Receiver()
+        events.info.connect(receiver.on_info)
+        events.info.send(self, message="First")
+
+        del receiver
+        events.info.send(self, message="Second")
+
+        self.assertLoggedEqual("Messages received", ["First"], received_messages)
+        self.assertLoggedFalse("Receivers remaining", bool(events.info.receivers))
+
+
+class CountingTranslationClient(DummyTranslationClient):
+    """ Translation client that counts requests sent to the provider """
+    def __init__(self, settings : SettingsType):
+        super().__init__(settings)
+        self.request_count = 0
+
+    def _request_translation(self, request : TranslationRequest, temperature : float|None = None) -> Translation|None:
+        self.request_count += 1
+        return Translation({'text': f"#1\nTranslation>\nResponse {self.request_count}\n"})
+
+class ResponseCacheTests(LoggedTestCase):
+    def _make_prompt(self, user_prompt : str) -> TranslationPrompt:
+        prompt = TranslationPrompt(user_prompt, False)
+        prompt.content = user_prompt
+        return prompt
+
+    def _request_and_cache(self, client : CountingTranslationClient, user_prompt : str, temperature : float|None = None) -> Translation|None:
+        """ Request a translation and accept the response, as the translator does when it passes validation """
+        prompt = self._make_prompt(user_prompt)
+        translation = client.RequestTranslation(prompt, temperature)
+        if translation:
+            client.CacheTranslation(prompt, translation, temperature)
+        return translation
+
+    def test_identical_prompts_reuse_cached_response(self):
+        """Identical prompts are only sent once when response caching is enabled"""
+        client = CountingTranslationClient(SettingsType({'instructions': 'Translate', 'cache_responses': True}))
+
+        first = self._request_and_cache(client, "Translate this")
+        second = self._request_and_cache(client, "Translate this")
+        self._request_and_cache(client, "Translate that")
+
+        self.assertLoggedEqual("requests sent to provider", 2, client.request_count)
+        self.assertLoggedEqual("cached response text", first.text if first else None, second.text if second else None)
+
+    def test_cached_response_is_a_copy(self):
+        """Changing a returned translation does not change the cached response"""
+        client = CountingTranslationClient(SettingsType({'instructions': 'Translate', 'cache_responses': True}))
+
+        first = self._request_and_cache(client, "Translate this")
+        second = self._request_and_cache(client, "Translate this")
+        assert first is not None and second is not None
+        first.content['text'] = "Changed"
+        second.content['text'] = "Changed"
+
+        third = self._request_and_cache(client, "Translate this")
+        self.assertLoggedEqual("cached response text", "#1\nTranslation>\nResponse 1\n", third.content.get('text') if third else None)
+
+    def test_responses_not_cached_by_default(self):
+        """Identical prompts are sent every time unless response caching is enabled"""
+        client = CountingTranslationClient(SettingsType({'instructions': 'Translate'}))
+
+        client.RequestTranslation(self._make_prompt("Translate this"))
+        client.RequestTranslation(self._make_prompt("Translate this"))
+
+        self.assertLoggedEqual("requests sent to provider", 2, client.request_count)
+
+    def test_responses_only_cached_when_accepted(self):
+        """Responses are not reused unless they were stored with CacheTranslation"""
+        client = CountingTranslationClient(SettingsType({'instructions': 'Translate', 'cache_responses': True}))
+
+        client.RequestTranslation(self._make_prompt("Translate this"))
+        client.RequestTranslation(self._make_prompt("Translate this"))
+
+        self.assertLoggedEqual("requests sent to provider", 2, client.request_count)
+
+    def test_use_cache_false_bypasses_cache(self):
+        """A request with use_cache=False is sent to the provider even if a response is cached"""
+        client = CountingTranslationClient(SettingsType({'instructions': 'Translate', 'cache_responses': True}))
+
+        self._request_and_cache(client, "Translate this")
+        client.RequestTranslation(self._make_prompt("Translate this"), use_cache=False)
+
+        self.assertLoggedEqual("requests sent to provider", 2, client.request_count)
+
+    def test_cached_responses_keyed_by_temperature(self):
+        """Identical prompts at different temperatures are not served from the same cache entry"""
+        client = CountingTranslationClient(SettingsType({'instructions': 'Translate', 'cache_responses': True}))
+
+        self._request_and_cache(client, "Translate this", temperature=0.0)
+        self._request_and_cache(client, "Translate this", temperature=0.7)
+        self._request_and_cache(client, "Translate this", temperature=0.7)
+
+        self.assertLoggedEqual("requests sent to provider", 2, client.request_count)
+
+    def test_cached_responses_explicit_zero_temperature(self):
+        """An explicit temperature of zero is not treated as the client's default temperature"""
+        client = CountingTranslationClient(SettingsType({'instructions': 'Translate', 'cache_responses': True, 'temperature': 0.7}))
+
+        self._request_and_cache(client, "Translate this")
+        self._request_and_cache(client, "Translate this", temperature=0.0)
+
+        self.assertLoggedEqual("requests sent to provider", 2, client.request_count)
+
+    def test_response_cache_discards_least_recently_used(self):
+        """The response cache is bounded, discarding the least recently used response when it is full"""
+        client = CountingTranslationClient(SettingsType({'instructions': 'Translate', 'cache_responses': True}))
+        client.RESPONSE_CACHE_SIZE = 2
+
+        self._request_and_cache(client, "First")
+        self._request_and_cache(client, "Second")
+        self._request_and_cache(client, "First")
+        self._request_and_cache(client, "Third")
+        self.assertLoggedEqual("requests before eviction check", 3, client.request_count)
+
+        self._request_and_cache(client, "First")
+        self.assertLoggedEqual("recently used response is kept", 3, client.request_count)
+
+        self._request_and_cache(client, "Second")
+        self.assertLoggedEqual("least recently used response is discarded", 4, client.request_count)
+
+    def test_cached_responses_skip_rate_limit(self):
+        """A cache hit returns without waiting for the rate limit"""
+        client = CountingTranslationClient(SettingsType({'instructions': 'Translate', 'cache_responses': True, 'rate_limit': 1.0}))
+
+        with patch('PySubtrans.TranslationClient.time.sleep') as mock_sleep:
+            self._request_and_cache(client, "Translate this")
+            self._request_and_cache(client, "Translate this")
+
+        self.assertLoggedEqual("requests sent to provider", 1, client.request_count)
+        self.assertLoggedFalse("slept for rate limit", mock_sleep.called)
 
 class FindBestSplitIndexTests(SubtitleTestCase):
     def test_FindBestSplitIndex_picks_largest_gap(self):
@@ -307,11 +477,11 @@ class SplitBatchTranslationTests(SubtitleTestCase):
         call_count = [0]
         original_request = self.translator.client.RequestTranslation
 
-        def fail_on_second_call(prompt, temperature=None, streaming_callback=None):
+        def fail_on_second_call(prompt, temperature=None, streaming_callback=None, use_cache=True):
             call_count[0] += 1
             if call_count[0] == 2:
                 return None
-            return original_request(prompt, temperature, streaming_callback)
+            return original_request(prompt, temperature, streaming_callback, use_cache)
 
         with patch.object(self.translator.client, 'RequestTranslation', side_effect=fail_on_second_call):
             result = self.translator._translate_split_batch(self.batch_1, None, self.context)
@@ -372,6 +542,30 @@ class SplitBatchTranslationTests(SubtitleTestCase):
 
         self.assertLoggedEqual("Retry not triggered when split succeeded", 0, mock_retry.call_count)
 
+    def test_only_accepted_translations_are_cached(self):
+        """TranslateBatch should only cache a response that passed validation"""
+        options = deepcopy(self.options)
+        options.add('autosplit_on_error', False)
+        provider = DummyProvider(data=chinese_dinner_data)
+        translator = SubtitleTranslator(options, translation_provider=provider)
+
+        with patch.object(translator.client, 'CacheTranslation') as mock_cache:
+            translator.TranslateBatch(self.batch_1, None, self.context)
+        self.assertLoggedEqual("Batch errors", 0, len(self.batch_1.errors or []))
+        self.assertLoggedEqual("Accepted translation cached", 1, mock_cache.call_count)
+
+        original_process = translator.ProcessBatchTranslation
+
+        def inject_errors(batch, translation, line_numbers=None):
+            original_process(batch, translation, line_numbers)
+            batch.errors = [SubtitleError("Injected test error")]
+
+        with patch.object(translator, 'ProcessBatchTranslation', side_effect=inject_errors):
+            with patch.object(translator.client, 'CacheTranslation') as mock_cache:
+                translator.TranslateBatch(self.batch_1, None, self.context)
+
+        self.assertLoggedEqual("Translation with errors not cached", 0, mock_cache.call_count)
+
 
 class TerminologyMapParsingTests(LoggedTestCase):
     """Tests for Translation.terminology property and <terminology> tag extraction"""
@@ -638,10 +832,10 @@ class TerminologyMapAccumulationTests(SubtitleTestCase):
         original_request = translator.client.RequestTranslation
         request_call_count = 0
 
-        def request_with_split_terminology(prompt, temperature=None, streaming_callback=None):
+        def request_with_split_terminology(prompt, temperature=None, streaming_callback=None, use_cache=True):
             nonlocal request_call_count
             request_call_count += 1
-            translation = original_request(prompt, temperature, streaming_callback)
+            translation = original_request(prompt, temperature, streaming_callback, use_cache)
             if not translation:
                 return None
 
@@ -1,10 +1,10 @@
 import unittest
 from datetime import timedelta
-import tempfile
-import os
+from unittest.mock import patch, mock_open
 
 from PySubtrans.Helpers.TestCases import LoggedTestCase
 from PySubtrans.Formats.VttFileHandler import VttFileHandler
+from PySubtrans.SubtitleFileHandler import default_encoding
 from PySubtrans.SubtitleLine import SubtitleLine
 from PySubtrans.SubtitleData import SubtitleData
 from PySubtrans.SubtitleError import SubtitleParseError
@@ -15,14 +15,18 @@ from PySubtrans.Helpers.Tests import (
 
 class TestVttFileHandler(LoggedTestCase):
     """Test cases for WebVTT file handler."""
+    handler : VttFileHandler
+    sample_vtt_content : str
+    expected_lines : list[SubtitleLine]
     
-    def setUp(self) -> None:
-        """Set up test fixtures."""
-        super().setUp()
-        self.handler = VttFileHandler()
+    @classmethod
+    def setUpClass(cls) -> None:
+        """Set up shared test fixtures (none of the tests modify them)."""
+        super().setUpClass()
+        cls.handler = VttFileHandler()
         
         # Sample VTT content for testing
-        self.sample_vtt_content = """WEBVTT
+        cls.sample_vtt_content = """WEBVTT
 
 00:00:01.500 --> 00:00:03.000
 First subtitle line
@@ -36,7 +40,7 @@ Third subtitle line with <i>formatting</i>
 """
         
         # Expected parsed lines
-        self.expected_lines = [
+        cls.expected_lines = [
             SubtitleLine.Construct(
                 number=1,
                 start=timedelta(seconds=1, milliseconds=500),
@@ -87,14 +91,11 @@ Third subtitle line with <i>formatting</i>
     def test_load_file(self):
         """Test parsing from file path."""
 
-        with tempfile.NamedTemporaryFile('w', delete=False, suffix='.vtt', encoding='utf-8') as f:
-            f.write(self.sample_vtt_content)
-            temp_path = f.name
+        # Serve the sample content from memory rather than writing it to disk
+        with patch('builtins.open', mock_open(read_data=self.sample_vtt_content)) as mock_file:
+            data = self.handler.load_file('subtitles.vtt')
 
-        try:
-            data = self.handler.load_file(temp_path)
-        finally:
-            os.remove(temp_path)
+        mock_file.assert_called_once_with('subtitles.vtt', 'r', encoding=default_encoding)
 
         lines = data.lines
         self.assertLoggedEqual('File content', 3, len(lines))
@@ -103,96 +104,85 @@ Third subtitle line with <i>formatting</i>
     def test_composition_variations(self):
         """Test composition of various WebVTT scenarios."""
         
-        test_cases = [
+        # Cue cases are independent, so compose them together as one file
+        cue_cases = [
             {
                 "test_name": "basic_composition",
-                "lines": [
-                    SubtitleLine.Construct(
-                        number=1,
-                        start=timedelta(seconds=1, milliseconds=500),
-                        end=timedelta(seconds=3),
-                        text="Test subtitle",
-                        metadata={}
-                    )
-                ],
-                "metadata": {},
+                "line": SubtitleLine.Construct(
+                    number=1,
+                    start=timedelta(seconds=1, milliseconds=500),
+                    end=timedelta(seconds=3),
+                    text="Test subtitle",
+                    metadata={}
+                ),
                 "should_contain": ["WEBVTT", "00:00:01.500 --> 00:00:03.000", "Test subtitle"]
             },
             {
                 "test_name": "html_formatting",
-                "lines": [
-                    SubtitleLine.Construct(
-                        number=1,
-                        start=timedelta(seconds=1),
-                        end=timedelta(seconds=3),
-                        text="Text with <i>italic</i> and <b>bold</b>",
-                        metadata={}
-                    )
-                ],
-                "metadata": {},
+                "line": SubtitleLine.Construct(
+                    number=2,
+                    start=timedelta(seconds=1),
+                    end=timedelta(seconds=3),
+                    text="Text with <i>italic</i> and <b>bold</b>",
+                    metadata={}
+                ),
                 "should_contain": ["Text with <i>italic</i> and <b>bold</b>"]
             },
             {
                 "test_name": "cue_id",
-                "lines": [
-                    SubtitleLine.Construct(
-                        number=1,
-                        start=timedelta(seconds=1),
-                        end=timedelta(seconds=3),
-                        text="First line",
-                        metadata={"cue_id": "cue1"}
-                    )
-                ],
-                "metadata": {},
+                "line": SubtitleLine.Construct(
+                    number=3,
+                    start=timedelta(seconds=1),
+                    end=timedelta(seconds=3),
+                    text="First line",
+                    metadata={"cue_id": "cue1"}
+                ),
                 "should_contain": ["cue1", "First line"]
             },
             {
                 "test_name": "cue_settings",
-                "lines": [
-                    SubtitleLine.Construct(
-                        number=1,
-                        start=timedelta(seconds=1),
-                        end=timedelta(seconds=3),
-                        text="Where did he go?",
-                        metadata={"vtt_settings": "position:10% align:left size:35%"}
-                    )
-                ],
-                "metadata": {},
+                "line": SubtitleLine.Construct(
+                    number=4,
+                    start=timedelta(seconds=1),
+                    end=timedelta(seconds=3),
+                    text="Where did he go?",
+                    metadata={"vtt_settings": "position:10% align:left size:35%"}
+                ),
                 "should_contain": ["position:10% align:left size:35%", "Where did he go?"]
             },
             {
                 "test_name": "voice_tags",
-                "lines": [
-                    SubtitleLine.Construct(
-                        number=1,
-                        start=timedelta(seconds=1),
-                        end=timedelta(seconds=3),
-                        text="Hello world",
-                        metadata={"speaker": "Mary", "voice_classes": ["loud"]}
-                    )
-                ],
-                "metadata": {},
+                "line": SubtitleLine.Construct(
+                    number=5,
+                    start=timedelta(seconds=1),
+                    end=timedelta(seconds=3),
+                    text="Hello world",
+                    metadata={"speaker": "Mary", "voice_classes": ["loud"]}
+                ),
                 "should_contain": ["<v.loud Mary>Hello world</v>"]
-            },
-            {
-                "test_name": "metadata_blocks",
-                "lines": [],
-                "metadata": {
-                    "vtt_styles": ["::cue {\n  color: red;\n}"],
-                    "vtt_notes": ["This is a test note"]
-                },
-                "should_contain": ["WEBVTT", "STYLE", "::cue", "color: red", "NOTE", "This is a test note"]
             }
         ]
         
-        for case in test_cases:
+        cue_data = SubtitleData(lines=[case["line"] for case in cue_cases], metadata={})
+        cue_result = self.handler.compose(cue_data)
+        
+        for case in cue_cases:
             with self.subTest(test_name=case["test_name"]):
                 log_test_name(f'VttFileHandler composition - {case["test_name"]}')
-                data = SubtitleData(lines=case["lines"], metadata=case["metadata"])
-                result = self.handler.compose(data)
-                
                 for expected_content in case["should_contain"]:
-                    self.assertLoggedIn(expected_content, expected_content, result)
+                    self.assertLoggedIn(expected_content, expected_content, cue_result)
+        
+        # File-level blocks with no cues exercise a different path, so compose them separately
+        with self.subTest(test_name="metadata_blocks"):
+            log_test_name('VttFileHandler composition - metadata_blocks')
+            metadata = {
+                "vtt_styles": ["::cue {\n  color: red;\n}"],
+                "vtt_notes": ["This is a test note"]
+            }
+            result = self.handler.compose(SubtitleData(lines=[], metadata=metadata))
+            
+            for expected_content in ["WEBVTT", "STYLE", "::cue", "color: red", "NOTE", "This is a test note"]:
+                self.assertLoggedIn(expected_content, expected_content, result)
     
     @skip_if_debugger_attached
     def test_parse_invalid_vtt_content(self):
@@ -209,7 +199,7 @@ Third subtitle line with <i>formatting</i>
     
     
     def test_round_trip_conversion(self):
-        """Test that parsing and composing results in similar content."""
+        """Test that composing parsed content reproduces the cue timings and text."""
         
         # Parse the sample content
         original_data = self.handler.parse_string(self.sample_vtt_content)
@@ -218,20 +208,15 @@ Third subtitle line with <i>formatting</i>
         # Compose back to WebVTT format using original metadata
         composed = self.handler.compose(original_data)
         
-        # Parse the composed content again
-        round_trip_data = self.handler.parse_string(composed)
-        round_trip_lines = round_trip_data.lines
-        
-        self.assertLoggedEqual('Original lines', len(original_lines), len(round_trip_lines))
+        # Inspect the composed output directly rather than parsing it again
+        self.assertLoggedTrue("Composed output has WEBVTT header", composed.startswith("WEBVTT"), input_value=composed[:20])
+        self.assertLoggedEqual('Composed cue count', len(original_lines), composed.count(' --> '))
         
-        # Validate metadata preservation
-        self.assertLoggedEqual("Metadata format preserved", original_data.detected_format, round_trip_data.detected_format)
-        
-        # Compare line properties
-        for original, round_trip in zip(original_lines, round_trip_lines):
-            self.assertEqual(original.start, round_trip.start)
-            self.assertEqual(original.end, round_trip.end)
-            self.assertEqual(original.text, round_trip.text)
+        for line in original_lines:
+            with self.subTest(line_number=line.number):
+                timing = f"{self.handler._format_timestamp(line.start)} --> {self.handler._format_timestamp(line.end)}"
+                self.assertIn(timing, composed)
+                self.assertIn(f"{timing}\n{line.text}\n", composed)
 
     def test_detect_vtt_format(self):
         """Ensure VTT files retain their format information."""
@@ -548,44 +533,30 @@ Styled subtitle
         rt_speakers = [line.metadata.get('speaker') for line in round_trip_data.lines]
         self.assertLoggedEqual('Round-trip speakers', expected_speakers, rt_speakers)
     
-    voice_tag_cases = {
-        "<v Mary>Hello world</v>": "Hello world",
-        "<v.class>Test text</v>": "Test text", 
-        "<v.first-second Mary>Hyphenated class</v>": "Hyphenated class",
-        "<v.multi-word-class John>Multiple hyphens</v>": "Multiple hyphens",
-        "<v.under_score-mixed>Mixed separators</v>": "Mixed separators",
-        "<v>No attributes</v>": "No attributes",
-        "<v.class1.class2>Multiple classes</v>": "Multiple classes",
-        "Text <v Speaker>with voice</v> inside": "Text <v Speaker>with voice</v> inside",
-        "<v.loud Mary>Start</v> and <v John>end</v>": "<v.loud Mary>Start</v> and <v John>end</v>"
-    }
-    
-    def test_voice_tag_stripping(self):
-        """Test that all voice tag variations are completely stripped."""
-        
-        for vtt_text, expected_clean in self.voice_tag_cases.items():
-            with self.subTest(vtt_text=vtt_text):
-                result_text, _ = self.handler._process_vtt_text(vtt_text)
-                self.assertLoggedEqual(vtt_text, expected_clean, result_text)
-    
-    voice_metadata_cases = {
-        "<v Mary>Hello</v>": {"speaker": "Mary"},
-        "<v.class>Test</v>": {"voice_classes": ["class"]},
-        "<v.first-second Mary>Text</v>": {"voice_classes": ["first-second"], "speaker": "Mary"},
-        "<v.class1.class2 John>Multiple</v>": {"voice_classes": ["class1", "class2"], "speaker": "John"},
-        "<v>No attrs</v>": {},
-        "<v.loud>Class only</v>": {"voice_classes": ["loud"]},
-        "<v Speaker>Name only</v>": {"speaker": "Speaker"},
-        "Text <v Speaker>partial</v> inside": {}
-    }
+    # (vtt text, expected clean text, expected metadata)
+    voice_tag_cases = [
+        ("<v Mary>Hello world</v>", "Hello world", {"speaker": "Mary"}),
+        ("<v.class>Test text</v>", "Test text", {"voice_classes": ["class"]}),
+        ("<v.first-second Mary>Hyphenated class</v>", "Hyphenated class", {"voice_classes": ["first-second"], "speaker": "Mary"}),
+        ("<v.multi-word-class John>Multiple hyphens</v>", "Multiple hyphens", {"voice_classes": ["multi-word-class"], "speaker": "John"}),
+        ("<v.under_score-mixed>Mixed separators</v>", "Mixed separators", {"voice_classes": ["under_score-mixed"]}),
+        ("<v>No attributes</v>", "No attributes", {}),
+        ("<v.class1.class2>Multiple classes</v>", "Multiple classes", {"voice_classes": ["class1", "class2"]}),
+        ("<v.class1.class2 John>Multiple</v>", "Multiple", {"voice_classes": ["class1", "class2"], "speaker": "John"}),
+        ("<v.loud>Class only</v>", "Class only", {"voice_classes": ["loud"]}),
+        ("<v Speaker>Name only</v>", "Name only", {"speaker": "Speaker"}),
+        ("Text <v Speaker>with voice</v> inside", "Text <v Speaker>with voice</v> inside", {}),
+        ("<v.loud Mary>Start</v> and <v John>end</v>", "<v.loud Mary>Start</v> and <v John>end</v>", {}),
+    ]
     
-    def test_voice_tag_metadata_extraction(self):
-        """Test that voice tag metadata is correctly extracted."""
+    def test_voice_tag_processing(self):
+        """Test that full-line voice tags are stripped and their metadata extracted."""
         
-        for vtt_text, expected_metadata in self.voice_metadata_cases.items():
+        for vtt_text, expected_clean, expected_metadata in self.voice_tag_cases:
             with self.subTest(vtt_text=vtt_text):
-                _, result = self.handler._process_vtt_text(vtt_text)
-                self.assertLoggedEqual(vtt_text, expected_metadata, result)
+                result_text, result_metadata = self.handler._process_vtt_text(vtt_text)
+                self.assertLoggedEqual(f"{vtt_text} text", expected_clean, result_text)
+                self.assertLoggedEqual(f"{vtt_text} metadata", expected_metadata, result_metadata)
     
     def test_voice_tag_round_trip(self):
         """Test that voice tags are preserved through parse/compose cycle."""